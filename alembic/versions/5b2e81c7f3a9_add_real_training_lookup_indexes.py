@@ -0,0 +1,30 @@
+"""add_real_training_lookup_indexes
+
+Revision ID: 5b2e81c7f3a9
+Revises: da4634c51411
+Create Date: 2026-10-17 11:05:12.734915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2e81c7f3a9'
+down_revision: Union[str, None] = 'da4634c51411'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_trainer_date_time', 'real_trainings', ['responsible_trainer_id', 'training_date', 'start_time'], unique=False)
+    op.create_index('idx_real_training_date', 'real_trainings', ['training_date'], unique=False)
+    op.create_index('idx_student_training', 'real_training_students', ['student_id', 'real_training_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_student_training', table_name='real_training_students')
+    op.drop_index('idx_real_training_date', table_name='real_trainings')
+    op.drop_index('idx_trainer_date_time', table_name='real_trainings')
@@ -0,0 +1,31 @@
+"""add_training_templates_trainer_index
+
+Revision ID: 5e8b2a7c4f19
+Revises: c9e41b7d2f50
+Create Date: 2026-10-17 17:02:36.184420
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8b2a7c4f19'
+down_revision: Union[str, None] = 'c9e41b7d2f50'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_training_templates_trainer_day_time',
+        'training_templates',
+        ['responsible_trainer_id', 'day_number', 'start_time'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_training_templates_trainer_day_time', table_name='training_templates')
@@ -0,0 +1,32 @@
+"""add_student_subscriptions_student_end_index
+
+Revision ID: 8c41d0e2a7b6
+Revises: 5b2e81c7f3a9
+Create Date: 2026-10-17 12:31:48.102367
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41d0e2a7b6'
+down_revision: Union[str, None] = '5b2e81c7f3a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_student_end_date',
+        'student_subscriptions',
+        ['student_id', 'end_date'],
+        unique=False,
+        postgresql_include=['subscription_id', 'sessions_left'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_student_end_date', table_name='student_subscriptions')
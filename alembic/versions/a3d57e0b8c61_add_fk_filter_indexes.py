@@ -0,0 +1,44 @@
+"""add_fk_filter_indexes
+
+Revision ID: a3d57e0b8c61
+Revises: f2c86d4a9e13
+Create Date: 2026-10-17 15:41:09.552874
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d57e0b8c61'
+down_revision: Union[str, None] = 'f2c86d4a9e13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (имя, таблица, колонки)
+INDEXES = (
+    ('ix_invoices_client_status', 'invoices', ['client_id', 'status']),
+    ('ix_invoices_student_status', 'invoices', ['student_id', 'status']),
+    ('ix_invoices_training_id', 'invoices', ['training_id']),
+    ('ix_invoices_created_at', 'invoices', ['created_at']),
+    ('ix_rts_training_student', 'real_training_students', ['real_training_id', 'student_id']),
+    ('ix_payment_history_client_created', 'payment_history', ['client_id', 'created_at']),
+    ('ix_client_contact_tasks_status_created', 'client_contact_tasks', ['status', 'created_at']),
+    ('ix_client_contact_tasks_client_reason_status', 'client_contact_tasks', ['client_id', 'reason', 'status']),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY не блокирует запись в таблицы, но не работает внутри транзакции
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
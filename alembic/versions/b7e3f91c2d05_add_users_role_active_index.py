@@ -0,0 +1,32 @@
+"""add_users_role_active_index
+
+Revision ID: b7e3f91c2d05
+Revises: 8c41d0e2a7b6
+Create Date: 2026-10-17 13:14:06.581940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3f91c2d05'
+down_revision: Union[str, None] = '8c41d0e2a7b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_users_role_active',
+        'users',
+        ['role'],
+        unique=False,
+        postgresql_where=sa.text('is_active = true'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_role_active', table_name='users')
@@ -0,0 +1,51 @@
+"""money_columns_numeric
+
+Revision ID: c9e41b7d2f50
+Revises: a3d57e0b8c61
+Create Date: 2026-10-17 16:10:33.804217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e41b7d2f50'
+down_revision: Union[str, None] = 'a3d57e0b8c61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (таблица, колонка) с денежными суммами
+MONEY_COLUMNS = (
+    ('invoices', 'amount'),
+    ('payments', 'amount'),
+    ('expenses', 'amount'),
+    ('payment_history', 'amount'),
+    ('payment_history', 'balance_before'),
+    ('payment_history', 'balance_after'),
+)
+
+
+def upgrade() -> None:
+    for table, column in MONEY_COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.Float(),
+            type_=sa.Numeric(12, 2),
+            existing_nullable=False,
+            postgresql_using=f'{column}::numeric(12,2)',
+        )
+
+
+def downgrade() -> None:
+    for table, column in MONEY_COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.Numeric(12, 2),
+            type_=sa.Float(),
+            existing_nullable=False,
+            postgresql_using=f'{column}::double precision',
+        )
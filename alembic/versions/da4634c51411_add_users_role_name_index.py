@@ -0,0 +1,26 @@
+"""add_users_role_name_index
+
+Revision ID: da4634c51411
+Revises: 307c1eed5b0c
+Create Date: 2026-10-17 10:12:41.508233
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'da4634c51411'
+down_revision: Union[str, None] = '307c1eed5b0c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_role_name', 'users', ['role', 'first_name', 'last_name', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_role_name', table_name='users')
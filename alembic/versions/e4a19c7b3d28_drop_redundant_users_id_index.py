@@ -0,0 +1,27 @@
+"""drop_redundant_users_id_index
+
+Revision ID: e4a19c7b3d28
+Revises: b7e3f91c2d05
+Create Date: 2026-10-17 14:05:12.318442
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a19c7b3d28'
+down_revision: Union[str, None] = 'b7e3f91c2d05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # users_pkey уже является btree-индексом по id
+    op.drop_index('ix_users_id', table_name='users')
+
+
+def downgrade() -> None:
+    op.create_index('ix_users_id', 'users', ['id'], unique=False)
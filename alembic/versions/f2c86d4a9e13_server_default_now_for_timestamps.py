@@ -0,0 +1,40 @@
+"""server_default_now_for_timestamps
+
+Revision ID: f2c86d4a9e13
+Revises: e4a19c7b3d28
+Create Date: 2026-10-17 15:02:47.119305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c86d4a9e13'
+down_revision: Union[str, None] = 'e4a19c7b3d28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (таблица, колонка) — время вставки теперь проставляет БД
+TIMESTAMP_COLUMNS = (
+    ('invoices', 'created_at'),
+    ('payments', 'payment_date'),
+    ('payment_history', 'created_at'),
+    ('expenses', 'expense_date'),
+    ('client_contact_tasks', 'created_at'),
+    ('real_trainings', 'created_at'),
+    ('real_trainings', 'updated_at'),
+)
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
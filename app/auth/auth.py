@@ -38,20 +38,20 @@ async def auth_google(authorization: str = Header(...), db: Session = Depends(ge
     """
     # Fetch user data from Google
     user_data = get_user_info_from_access_token(authorization)
-    logger.debug(f"User data from Google: {user_data}")
+    logger.debug("User data from Google: %s", user_data)
 
     # Check if user exists in the database
     user = get_user_by_email(db, email=user_data["email"])
-    logger.debug(f"User found in the database: {user.role}")
     if not user:
         raise HTTPException(status_code=403, detail="Access denied: user not found.")
+    logger.debug("User found in the database: %s", user.role)
 
     # Generate access and refresh tokens
     access_token = create_access_token(data={"sub": user.email, "id": user.id, "role": user.role.value})
     refresh_token = create_refresh_token(data={"sub": user.email, "id": user.id, "role": user.role.value})
 
-    logger.debug(f"Access token: {access_token}", )
-    logger.debug(f"Refresh token: {refresh_token}")
+    logger.debug("Access token: %s", access_token)
+    logger.debug("Refresh token: %s", refresh_token)
 
     return {"access_token": access_token, "refresh_token": refresh_token}
 
@@ -72,5 +72,5 @@ async def logout(current_user = Depends(verify_jwt_token)):
     Logout endpoint that invalidates the current user's session.
     In a production environment, you might want to implement a token blacklist.
     """
-    logger.info(f"User {current_user['email']} logged out")
+    logger.info("User %s logged out", current_user['email'])
     return {"message": "Successfully logged out"}
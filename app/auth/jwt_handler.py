@@ -18,11 +18,10 @@ def verify_jwt_token(token: str = Depends(oauth2_scheme_access)):
     """
     Verify JWT access token for correctness and expiration time.
     """
-    print("Verify JWT token:")
     try:
         if config.ENVIRONMENT == "dev":
             if token == "dev_token":
-                print("returning dev_token")
+                logger.debug("Returning dev_token user")
                 return {"email": config.DEV_ADMIN_EMAIL, "role": "ADMIN", "id": 1}
         # Decode the JWT token
         payload = jwt.decode(token, config.JWT_SECRET_KEY, algorithms=[config.JWT_ALGORITHM])
@@ -32,25 +31,22 @@ def verify_jwt_token(token: str = Depends(oauth2_scheme_access)):
         exp = payload.get("exp")
 
         if exp is None:
-            print("exp is None")
             raise HTTPException(status_code=401, detail="Missing 'exp' field in token")
 
         current_time = datetime.now(tz=timezone.utc)
         token_exp_time = datetime.fromtimestamp(exp, tz=timezone.utc)
-        logger.debug(f"Token expiration time: {token_exp_time}")
-        logger.debug(f"Current time: {current_time}")
+        logger.debug("Token expiration time: %s, current time: %s", token_exp_time, current_time)
         if token_exp_time < current_time:
             raise HTTPException(status_code=401, detail="Token has expired")
 
-        logger.debug(f"Token payload: {payload}")
+        logger.debug("Token payload: %s", payload)
         # Return payload details (like email, role, id) on success
         # Handle both "sub" and "email" fields for backward compatibility
         email = payload.get("sub") or payload.get("email")
         return {"email": email, "role": payload["role"], "id": payload["id"]}
 
     except JWTError as e:
-        print("JWTError exception:")
-        logger.error(f"JWT verification error: {str(e)}")
+        logger.error("JWT verification error: %s", e)
         raise HTTPException(status_code=401, detail="Token is invalid or expired")
 
 
@@ -82,9 +78,9 @@ def refresh_access_token(token: str) -> str:
     """
     try:
         # Decode the refresh token
-        logger.debug(f"Received refresh token: {token}")
+        logger.debug("Received refresh token: %s", token)
         payload = jwt.decode(token, config.JWT_SECRET_KEY, algorithms=[config.JWT_ALGORITHM])
-        logger.debug(f"Refresh token payload: {payload}")
+        logger.debug("Refresh token payload: %s", payload)
         exp = payload.get("exp")
 
         # Ensure refresh token has not expired
@@ -98,7 +94,7 @@ def refresh_access_token(token: str) -> str:
         return new_access_token
 
     except JWTError as e:
-        logger.error(f"Error during refresh token validation: {e}")
+        logger.error("Error during refresh token validation: %s", e)
         raise HTTPException(status_code=401, detail="Invalid or expired refresh token.")
 
 
@@ -29,6 +29,9 @@ def get_current_user(allowed_roles: Optional[List[str]] = None):
         def any_user(current_user=Depends(get_current_user())):
             return {"message": "User access granted"}
     """
+    # Множество ролей строится один раз при объявлении эндпоинта, а не на каждый запрос
+    allowed_role_set = frozenset(allowed_roles) if allowed_roles is not None else None
+
     def dependency(current_user_data = Depends(verify_jwt_token)):
         if not current_user_data:
             raise HTTPException(
@@ -37,7 +40,7 @@ def get_current_user(allowed_roles: Optional[List[str]] = None):
             )
             
         # If no roles specified, allow any authenticated user
-        if allowed_roles is None:
+        if allowed_role_set is None:
             return current_user_data
             
         user_role = current_user_data.get("role")
@@ -48,7 +51,7 @@ def get_current_user(allowed_roles: Optional[List[str]] = None):
             )
             
         # Check if user role is in allowed roles
-        if user_role not in allowed_roles:
+        if user_role not in allowed_role_set:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Access denied. Required roles: {allowed_roles}, your role: {user_role}"
@@ -94,4 +94,4 @@ def admin_exists_by_email(db: Session, email: str, exclude_id: Optional[int] = N
     if exclude_id:
         query = query.filter(User.id != exclude_id)
     
-    return query.first() is not None
+    return db.query(query.exists()).scalar()
@@ -1,11 +1,46 @@
+from sqlalchemy import Row, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
+from app.crud.user import get_users_by_role
 from app.models.user import User, UserRole
 from app.schemas import ClientCreate, ClientUpdate
 
 
-def create_client(db: Session, client_data: ClientCreate) -> User:
-    """Creates a new client user in the database without committing."""
-    client = User(
+# Колонки, которые читает ClientResponse: список клиентов отдается без
+# salary/is_fixed_salary/deactivation_date и без ORM-объектов
+CLIENT_LIST_COLUMNS = (
+    User.id,
+    User.first_name,
+    User.last_name,
+    User.date_of_birth,
+    User.email,
+    User.phone_country_code,
+    User.phone_number,
+    User.role,
+    User.is_authenticated_with_google,
+    User.whatsapp_country_code,
+    User.whatsapp_number,
+    User.balance,
+    User.is_active,
+)
+
+
+# Диалекты, где INSERT ... ON CONFLICT DO NOTHING RETURNING поддерживается
+_UPSERT_INSERTS = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+def create_client(db: Session, client_data: ClientCreate) -> User | None:
+    """
+    Creates a new client user in the database without committing.
+
+    Returns None if the email or phone number is already taken: the insert
+    uses ON CONFLICT DO NOTHING, so a duplicate costs no exception/rollback.
+    """
+    values = dict(
         first_name=client_data.first_name,
         last_name=client_data.last_name,
         date_of_birth=client_data.date_of_birth,
@@ -16,8 +51,14 @@ def create_client(db: Session, client_data: ClientCreate) -> User:
         whatsapp_number=client_data.whatsapp_number,
         balance=0,
         role=UserRole.CLIENT,
-        is_authenticated_with_google=True  # Assuming default, can be changed by a service
+        is_authenticated_with_google=True,
     )
+    insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if insert is not None:
+        stmt = insert(User).values(**values).on_conflict_do_nothing().returning(User)
+        return db.scalars(stmt).first()
+
+    client = User(**values)
     db.add(client)
     db.flush()  # Flush to assign an ID to the client object
     return client
@@ -30,7 +71,22 @@ def get_client_by_id(db: Session, client_id: int) -> User | None:
 
 def get_all_clients(db: Session) -> list[User]:
     """Retrieves all clients from the database."""
-    return db.query(User).filter(User.role == UserRole.CLIENT).order_by(User.first_name, User.last_name).all()
+    return get_users_by_role(db, UserRole.CLIENT)
+
+
+def get_client_list_rows(db: Session) -> list[Row]:
+    """
+    Retrieves clients for the list endpoint as plain rows.
+
+    Only CLIENT_LIST_COLUMNS are selected and no User objects are built,
+    so rows skip ORM hydration and the identity map.
+    """
+    stmt = (
+        select(*CLIENT_LIST_COLUMNS)
+        .where(User.role == UserRole.CLIENT)
+        .order_by(User.first_name, User.last_name, User.id)
+    )
+    return db.execute(stmt).all()
 
 
 def update_client(db: Session, client_id: int, client_data: ClientUpdate) -> User | None:
@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import List, Optional
 from sqlalchemy import and_, desc
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, selectinload
 
 from app.models import Invoice, InvoiceStatus, InvoiceType
 from app.schemas.invoice import InvoiceCreate, InvoiceUpdate
@@ -29,7 +29,7 @@ def get_invoices(
     """
     Get a list of invoices with filters
     """
-    query = db.query(Invoice).options(joinedload(Invoice.client))
+    query = db.query(Invoice).options(selectinload(Invoice.client))
     
     if client_id:
         query = query.filter(Invoice.client_id == client_id)
@@ -40,7 +40,7 @@ def get_invoices(
     if invoice_type:
         query = query.filter(Invoice.type == invoice_type)
         
-    return query.order_by(desc(Invoice.created_at)).offset(skip).limit(limit).all()
+    return query.order_by(desc(Invoice.created_at), desc(Invoice.id)).offset(skip).limit(limit).all()
 
 
 def get_student_invoices(
@@ -59,7 +59,7 @@ def get_student_invoices(
     if status:
         query = query.filter(Invoice.status == status)
         
-    return query.order_by(desc(Invoice.created_at)).offset(skip).limit(limit).all()
+    return query.order_by(desc(Invoice.created_at), desc(Invoice.id)).offset(skip).limit(limit).all()
 
 
 def get_client_invoices(
@@ -78,7 +78,7 @@ def get_client_invoices(
     if status:
         query = query.filter(Invoice.status == status)
         
-    return query.order_by(desc(Invoice.created_at)).offset(skip).limit(limit).all()
+    return query.order_by(desc(Invoice.created_at), desc(Invoice.id)).offset(skip).limit(limit).all()
 
 
 def get_training_invoice(
@@ -219,7 +219,7 @@ def get_unpaid_invoices(
     if student_id:
         query = query.filter(Invoice.student_id == student_id)
         
-    return query.order_by(Invoice.created_at).all()
+    return query.order_by(Invoice.created_at, Invoice.id).all()
 
 
 def get_paid_invoices(
@@ -36,7 +36,7 @@ def get_payments(
     if registered_by_id:
         query = query.filter(Payment.registered_by_id == registered_by_id)
         
-    return query.order_by(desc(Payment.payment_date)).offset(skip).limit(limit).all()
+    return query.order_by(desc(Payment.payment_date), desc(Payment.id)).offset(skip).limit(limit).all()
 
 
 def get_client_payments(
@@ -159,7 +159,7 @@ def get_active_payments(
     if registered_by_id:
         query = query.filter(Payment.registered_by_id == registered_by_id)
         
-    return query.order_by(desc(Payment.payment_date)).all()
+    return query.order_by(desc(Payment.payment_date), desc(Payment.id)).all()
 
 
 def get_cancelled_payments(
@@ -205,4 +205,4 @@ def get_payment_history(
     """
     return db.query(PaymentHistory).filter(
         PaymentHistory.client_id == client_id
-    ).order_by(desc(PaymentHistory.created_at)).offset(skip).limit(limit).all()
+    ).order_by(desc(PaymentHistory.created_at), desc(PaymentHistory.id)).offset(skip).limit(limit).all()
@@ -1,7 +1,7 @@
 from datetime import datetime, date, timedelta
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy import and_
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm import Session, joinedload, selectinload, undefer
 import logging
 from datetime import timezone
 
@@ -29,6 +29,20 @@ from app.schemas.real_training_student import (
 logger = logging.getLogger(__name__)
 
 
+def _training_read_options():
+    """
+    Явная загрузка всего, что читает RealTrainingResponse:
+    тренер, тип, студенты и их клиенты — без ленивых запросов на каждую строку.
+    """
+    return (
+        selectinload(RealTraining.students)
+        .selectinload(RealTrainingStudent.student)
+        .options(selectinload(Student.client), undefer(Student.has_unpaid_invoice)),
+        selectinload(RealTraining.trainer),
+        selectinload(RealTraining.training_type),
+    )
+
+
 def get_real_trainings_with_students(
     db: Session,
     *,
@@ -40,13 +54,8 @@ def get_real_trainings_with_students(
 ) -> List[RealTraining]:
     """
     Получение списка реальных тренировок с привязанными студентами за период
-    Использует joinedload для оптимизации запросов к БД
     """
-    query = db.query(RealTraining).options(
-        joinedload(RealTraining.students),
-        joinedload(RealTraining.training_type),
-        joinedload(RealTraining.trainer),
-    )
+    query = db.query(RealTraining).options(*_training_read_options())
 
     if start_date:
         query = query.filter(RealTraining.training_date >= start_date)
@@ -76,7 +85,8 @@ def get_real_trainings(
     """
     Получение списка реальных тренировок с фильтрами
     """
-    query = db.query(RealTraining)
+    # Ответ списка всегда сериализует студентов, поэтому загружаем их явно
+    query = db.query(RealTraining).options(*_training_read_options())
 
     if start_date:
         query = query.filter(RealTraining.training_date >= start_date)
@@ -98,11 +108,7 @@ def get_real_training(db: Session, training_id: int) -> Optional[RealTraining]:
     """
     return (
         db.query(RealTraining)
-        .options(
-            selectinload(RealTraining.students).selectinload(RealTrainingStudent.student).selectinload(Student.client),
-            joinedload(RealTraining.trainer),
-            joinedload(RealTraining.training_type),
-        )
+        .options(*_training_read_options())
         .filter(RealTraining.id == training_id)
         .first()
     )
@@ -266,7 +272,7 @@ def update_student_attendance_db(
     Предполагается, что все бизнес-проверки уже выполнены в сервисном слое.
     """
     if "status" in update_dict:
-        update_dict["attendance_marked_at"] = datetime.utcnow()
+        update_dict["attendance_marked_at"] = datetime.now(timezone.utc)
         update_dict["attendance_marked_by_id"] = marker_id
 
     for field, value in update_dict.items():
@@ -297,6 +303,25 @@ def remove_student_from_training(
     return True
 
 
+def _active_subscriptions_by_student(
+    db: Session, student_ids: List[int], on_date: date
+) -> Dict[int, StudentSubscription]:
+    """Активные абонементы на дату для набора студентов — одним запросом."""
+    if not student_ids:
+        return {}
+    subscriptions = db.query(StudentSubscription).filter(
+        StudentSubscription.student_id.in_(student_ids),
+        StudentSubscription.active_clause(),
+        StudentSubscription.start_date <= on_date,
+        StudentSubscription.end_date >= on_date,
+    ).order_by(StudentSubscription.id.asc()).all()
+
+    result: Dict[int, StudentSubscription] = {}
+    for subscription in subscriptions:
+        result.setdefault(subscription.student_id, subscription)
+    return result
+
+
 def generate_trainings_for_template(db: Session, template_id: int) -> Tuple[int, List[RealTraining]]:
     """Генерирует тренировки по конкретному шаблону на текущую и следующую неделю.
 
@@ -321,10 +346,12 @@ def generate_trainings_for_template(db: Session, template_id: int) -> Tuple[int,
         week_monday = current_monday + timedelta(weeks=week_offset)
         training_date = week_monday + timedelta(days=template.day_number - 1)
 
-        existing = db.query(RealTraining).filter(
-            RealTraining.template_id == template.id,
-            RealTraining.training_date == training_date,
-        ).first()
+        existing = db.query(
+            db.query(RealTraining).filter(
+                RealTraining.template_id == template.id,
+                RealTraining.training_date == training_date,
+            ).exists()
+        ).scalar()
         if existing:
             continue
 
@@ -342,7 +369,7 @@ def generate_trainings_for_template(db: Session, template_id: int) -> Tuple[int,
         max_participants = template.training_type.max_participants
 
         potential_students = db.query(TrainingStudentTemplate).options(
-            joinedload(TrainingStudentTemplate.student)
+            selectinload(TrainingStudentTemplate.student)
         ).filter(
             TrainingStudentTemplate.training_template_id == template.id,
             TrainingStudentTemplate.is_frozen.is_(False),
@@ -352,18 +379,19 @@ def generate_trainings_for_template(db: Session, template_id: int) -> Tuple[int,
             TrainingStudentTemplate.id.asc(),
         ).all()
 
+        active_subs = {}
+        if template.training_type.is_subscription_only:
+            active_subs = _active_subscriptions_by_student(
+                db, [ts.student_id for ts in potential_students], training_date
+            )
+
         added = 0
         for ts in potential_students:
             if added >= max_participants:
                 break
 
             if template.training_type.is_subscription_only:
-                active_sub = db.query(StudentSubscription).filter(
-                    StudentSubscription.student_id == ts.student_id,
-                    StudentSubscription.status == 'active',
-                    StudentSubscription.start_date <= training_date,
-                    StudentSubscription.end_date >= training_date,
-                ).first()
+                active_sub = active_subs.get(ts.student_id)
                 if not active_sub or (active_sub.sessions_left <= 0 and not active_sub.is_auto_renew):
                     continue
 
@@ -429,12 +457,14 @@ def generate_next_week_trainings(db: Session) -> Tuple[int, List[RealTraining]]:
         template_date = next_monday + timedelta(days=template.day_number - 1)
         
         # Проверяем, не создана ли уже тренировка по этому шаблону
-        existing_training = db.query(RealTraining).filter(
-            and_(
-                RealTraining.template_id == template.id,
-                RealTraining.training_date == template_date
-            )
-        ).first()
+        existing_training = db.query(
+            db.query(RealTraining).filter(
+                and_(
+                    RealTraining.template_id == template.id,
+                    RealTraining.training_date == template_date
+                )
+            ).exists()
+        ).scalar()
         
         if not existing_training:
             if not template.training_type:
@@ -457,7 +487,7 @@ def generate_next_week_trainings(db: Session) -> Tuple[int, List[RealTraining]]:
             
             # Копируем студентов из шаблона, учитывая start_date и max_participants
             template_students_query = db.query(TrainingStudentTemplate).options(
-                joinedload(TrainingStudentTemplate.student)
+                selectinload(TrainingStudentTemplate.student)
             ).filter(
                 and_(
                     TrainingStudentTemplate.training_template_id == template.id,
@@ -470,6 +500,12 @@ def generate_next_week_trainings(db: Session) -> Tuple[int, List[RealTraining]]:
             )
             
             potential_students = template_students_query.all()
+
+            active_subscriptions = {}
+            if template.training_type.is_subscription_only:
+                active_subscriptions = _active_subscriptions_by_student(
+                    db, [ts.student_id for ts in potential_students], template_date
+                )
             
             added_students_count = 0
             for template_student in potential_students:
@@ -486,12 +522,7 @@ def generate_next_week_trainings(db: Session) -> Tuple[int, List[RealTraining]]:
                     can_add_student = True
                 else:
                     # Ищем активный абонемент у студента на дату будущей тренировки
-                    active_subscription = db.query(StudentSubscription).filter(
-                        StudentSubscription.student_id == template_student.student_id,
-                        StudentSubscription.status == 'active',
-                        StudentSubscription.start_date <= template_date,
-                        StudentSubscription.end_date >= template_date,
-                    ).first()
+                    active_subscription = active_subscriptions.get(template_student.student_id)
 
                     if active_subscription and (active_subscription.sessions_left > 0 or active_subscription.is_auto_renew):
                         can_add_student = True
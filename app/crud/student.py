@@ -1,7 +1,8 @@
 import logging
-from sqlalchemy.orm import Session
+from typing import Iterable
+from sqlalchemy.orm import Session, selectinload, undefer
 from app.models.student import Student
-from app.schemas.student import StudentCreate, StudentUpdate
+from app.schemas.student import StudentCreate, StudentCreateWithoutClient, StudentUpdate
 
 logger = logging.getLogger(__name__)
 
@@ -12,12 +13,16 @@ def get_student_by_id(db: Session, student_id: int) -> Student | None:
 
 def get_students_by_client_id(db: Session, client_id: int) -> list[Student]:
     """Retrieves all students associated with a specific client ID."""
-    return db.query(Student).filter(Student.client_id == client_id).order_by(Student.first_name, Student.last_name).all()
+    return db.query(Student).options(undefer(Student.has_unpaid_invoice)).filter(Student.client_id == client_id).order_by(Student.first_name, Student.last_name).all()
 
 
 def get_all_students(db: Session) -> list[Student]:
     """Retrieves all students from the database."""
-    return db.query(Student).all()
+    # StudentResponse читает client и has_unpaid_invoice — клиенты одним IN-запросом,
+    # флаг неоплаченного инвойса в том же SELECT
+    return db.query(Student).options(
+        selectinload(Student.client), undefer(Student.has_unpaid_invoice)
+    ).all()
 
 
 def create_student(db: Session, student_data: StudentCreate, client_id: int) -> Student:
@@ -36,6 +41,23 @@ def create_student(db: Session, student_data: StudentCreate, client_id: int) ->
     return new_student
 
 
+def create_students(db: Session, students_data: Iterable[StudentCreateWithoutClient], client_id: int) -> list[Student]:
+    """Creates several students for one client in a single flush without committing."""
+    new_students = [
+        Student(
+            first_name=student_data.first_name,
+            last_name=student_data.last_name,
+            date_of_birth=student_data.date_of_birth,
+            client_id=client_id,
+            is_active=True
+        )
+        for student_data in students_data
+    ]
+    db.add_all(new_students)
+    db.flush()
+    return new_students
+
+
 def update_student(db: Session, student_id: int, student_data: StudentUpdate) -> Student | None:
     """Updates a student's data without committing."""
     student = get_student_by_id(db, student_id)
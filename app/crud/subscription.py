@@ -1,7 +1,7 @@
 from datetime import date, datetime, timezone
 from typing import List, Optional
 from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.models import Subscription, StudentSubscription
 from app.schemas.subscription import SubscriptionCreate, SubscriptionUpdate
@@ -114,14 +114,19 @@ def get_student_subscriptions(
     *,
     status: Optional[str] = None,
     include_expired: bool = False,
+    with_subscription: bool = False,
 ) -> List[StudentSubscription]:
     """
     Получение абонементов студента
+
+    with_subscription — сразу загрузить шаблоны абонементов (один IN-запрос)
     """
     from datetime import datetime
     query = db.query(StudentSubscription).filter(
         StudentSubscription.student_id == student_id
     )
+    if with_subscription:
+        query = query.options(selectinload(StudentSubscription.subscription))
     now = datetime.now().replace(microsecond=0)
     if status:
         if status == "active":
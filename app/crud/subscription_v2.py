@@ -3,7 +3,7 @@
 Все функции используют db.flush() (не db.commit()).
 Транзакции — только на уровне сервиса.
 """
-from datetime import date, datetime, timezone
+from datetime import date, datetime, time, timedelta, timezone
 from typing import Optional
 
 from sqlalchemy import and_, func
@@ -15,6 +15,16 @@ from app.models.training_type import TrainingType
 from app.models.invoice import InvoiceStatus
 
 
+def day_bounds(day: date) -> tuple[datetime, datetime]:
+    """Полуинтервал [начало дня, начало следующего дня) в UTC.
+
+    Сравнение timestamp-колонки с границами дня использует индекс,
+    в отличие от func.date(column), который считается для каждой строки.
+    """
+    start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+    return start, start + timedelta(days=1)
+
+
 # ---------------------------------------------------------------------------
 # SystemSettings
 # ---------------------------------------------------------------------------
@@ -51,13 +61,14 @@ def get_active_or_pending_subscription(
 
     Frozen и pending_schedule абонементы исключаются.
     """
+    day_start, next_day_start = day_bounds(training_date)
     return (
         db.query(StudentSubscription)
         .filter(
             and_(
                 StudentSubscription.student_id == student_id,
-                func.date(StudentSubscription.start_date) <= training_date,
-                func.date(StudentSubscription.end_date) >= training_date,
+                StudentSubscription.start_date < next_day_start,
+                StudentSubscription.end_date >= day_start,
                 # Только подтверждённые (не pending_schedule)
                 StudentSubscription.schedule_confirmed_at.isnot(None),
                 # Исключаем замороженные
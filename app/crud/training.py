@@ -1,7 +1,7 @@
 from datetime import date
 from typing import List, Optional
 from sqlalchemy import and_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.models import RealTraining, RealTrainingStudent
 from app.schemas.real_training import RealTrainingCreate, RealTrainingUpdate
@@ -26,7 +26,7 @@ def get_training_with_relations(db: Session, training_id: int) -> Optional[RealT
     return db.query(RealTraining).options(
         joinedload(RealTraining.trainer),
         joinedload(RealTraining.training_type),
-        joinedload(RealTraining.students),
+        selectinload(RealTraining.students),
     ).filter(RealTraining.id == training_id).first()
 
 
@@ -71,7 +71,7 @@ def get_trainings_with_students(
     Получение списка тренировок с привязанными студентами
     """
     query = db.query(RealTraining).options(
-        joinedload(RealTraining.students),
+        selectinload(RealTraining.students),
         joinedload(RealTraining.training_type),
         joinedload(RealTraining.trainer),
     )
@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm import Session, selectinload
 from fastapi import HTTPException
 from app.models import TrainingTemplate, TrainingStudentTemplate
 from app.schemas.training_template import (
@@ -109,12 +109,12 @@ def delete_training_template(db: Session, template_id: int):
 
 # Получение списка всех студент-шаблонов
 def get_training_student_templates(db: Session):
-    return db.query(TrainingStudentTemplate).options(joinedload(TrainingStudentTemplate.student)).all()
+    return db.query(TrainingStudentTemplate).options(selectinload(TrainingStudentTemplate.student)).all()
 
 
 # Получение студент-шаблона по ID
 def get_training_student_template_by_id(db: Session, student_template_id: int):
-    return db.query(TrainingStudentTemplate).options(joinedload(TrainingStudentTemplate.student)).filter(TrainingStudentTemplate.id == student_template_id).first()
+    return db.query(TrainingStudentTemplate).options(selectinload(TrainingStudentTemplate.student)).filter(TrainingStudentTemplate.id == student_template_id).first()
 
 
 # Создание нового студент-шаблона
@@ -1,18 +1,59 @@
 from typing import List, Optional
+from sqlalchemy import lambda_stmt, or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.models import User, UserRole
 from app.schemas import UserUpdate, ClientCreate
 
 
+# Уникальные ограничения users -> текст ошибки для API
+USER_UNIQUE_VIOLATIONS = (
+    ("users_email_key", "User with this email already exists"),
+    ("users_phone_number_key", "User with this phone number already exists"),
+    ("users.email", "User with this email already exists"),
+    ("users.phone_number", "User with this phone number already exists"),
+)
+
+
+def unique_violation_message(exc: IntegrityError) -> Optional[str]:
+    """
+    Текст ошибки для нарушения уникальности email/телефона, иначе None.
+
+    На psycopg2 имя ограничения берется из diag без строкового поиска;
+    для остальных драйверов (SQLite в тестах) — из текста ошибки.
+    """
+    diag = getattr(exc.orig, "diag", None)
+    constraint = getattr(diag, "constraint_name", None)
+    text = constraint or str(exc.orig)
+    for marker, message in USER_UNIQUE_VIOLATIONS:
+        if marker in text:
+            return message
+    return None
+
+
 def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
-    return db.query(User).filter(User.id == user_id).first()
+    # Session.get сначала смотрит identity map и не ходит в БД для уже загруженных
+    return db.get(User, user_id)
 
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     """
     Get a user by email
     """
-    return db.query(User).filter(User.email == email).first()
+    # Вызывается на каждом логине: lambda_stmt не пересобирает и не
+    # перекомпилирует SELECT, email уходит как параметр
+    stmt = lambda_stmt(lambda: select(User).where(User.email == email))
+    return db.execute(stmt).scalar_one_or_none()
+
+
+def get_user_by_email_or_phone(db: Session, email: str, phone_number: str) -> Optional[User]:
+    """
+    Get a user that already uses this email or phone number (one query for both checks)
+    """
+    stmt = lambda_stmt(
+        lambda: select(User).where(or_(User.email == email, User.phone_number == phone_number)).limit(1)
+    )
+    return db.scalars(stmt).first()
 
 
 def get_all_users(db: Session) -> List[User]:
@@ -33,7 +74,11 @@ def get_users_by_role(db: Session, role: str) -> List[User]:
     """
     Get users by role
     """
-    return db.query(User).filter(User.role == role).order_by(User.first_name, User.last_name).all()
+    # lambda_stmt кеширует построение запроса: значения из замыкания
+    # подставляются как параметры, SQL собирается один раз
+    stmt = lambda_stmt(lambda: select(User).where(User.role == role))
+    stmt += lambda s: s.order_by(User.first_name, User.last_name, User.id)
+    return list(db.scalars(stmt))
 
 
 def create_user(db: Session, user: ClientCreate) -> User:
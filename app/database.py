@@ -1,4 +1,5 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
 from contextlib import contextmanager
@@ -11,6 +12,17 @@ engine = create_engine(config.SQLALCHEMY_DATABASE_URI)
 # Создаем сессию для работы с базой данных
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Асинхронный движок (asyncpg) для обработчиков, которые не должны занимать
+# поток из threadpool. Пока им пользуется только /health, поэтому пул маленький
+async_engine = create_async_engine(
+    config.SQLALCHEMY_ASYNC_DATABASE_URI,
+    pool_size=2,
+    max_overflow=2,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
 # Базовый класс для всех моделей
 Base = declarative_base()
 
@@ -1,4 +1,4 @@
-from app.database import SessionLocal
+from app.database import AsyncSessionLocal, SessionLocal
 
 # Функция для получения сессии базы данных
 def get_db():
@@ -8,4 +8,10 @@ def get_db():
     finally:
         db.close()
 
+
+# Асинхронная сессия для async-обработчиков
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
 # Import simple role-based dependency
@@ -1,5 +1,6 @@
 import logging
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -9,6 +10,7 @@ from app.schemas.user import ClientCreate, ClientResponse, ClientUpdate, StatusU
 from app.schemas.student import StudentResponse
 from app.crud import client as crud_client
 from app.crud import student as crud_student
+from app.crud import user as crud_user
 from app.services.client_service import client_service
 
 router = APIRouter(prefix="/clients", tags=["Clients"])
@@ -27,7 +29,11 @@ def create_client_endpoint(client_data: ClientCreate, db: Session = Depends(get_
 @router.get("/", response_model=list[ClientResponse])
 def get_clients_endpoint(db: Session = Depends(get_db), current_user=Depends(get_current_user(["ADMIN", "OWNER"]))):
     logger.info("calling get all clients")
-    return crud_client.get_all_clients(db)
+    # Строки из БД уже валидны: собираем ответ без повторной валидации
+    return Response(
+        content=ClientResponse.list_json(crud_client.get_client_list_rows(db)),
+        media_type="application/json",
+    )
 
 
 @router.get("/{client_id}", response_model=ClientResponse)
@@ -35,7 +41,7 @@ def get_client_endpoint(client_id: int, db: Session = Depends(get_db), current_u
     client = crud_client.get_client_by_id(db, client_id)
     if not client:
         raise HTTPException(status_code=404, detail="Client not found")
-    return client
+    return ClientResponse.from_orm_trusted(client)
 
 
 @router.get("/{client_id}/students", response_model=List[StudentResponse])
@@ -52,7 +58,14 @@ def update_client_endpoint(client_id: int, client_data: ClientUpdate, db: Sessio
     updated_client = crud_client.update_client(db, client_id, client_data)
     if not updated_client:
         raise HTTPException(status_code=404, detail="Client not found")
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        message = crud_user.unique_violation_message(e)
+        if message is None:
+            raise
+        raise HTTPException(status_code=400, detail=message)
     db.refresh(updated_client)
     return updated_client
 
@@ -1,7 +1,36 @@
-from fastapi import APIRouter
+import logging
+import time
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies import get_async_db
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Результат проверки БД кешируется на пару секунд, чтобы частые пробы
+# балансировщика не ходили в базу каждый раз
+HEALTH_CHECK_TTL_SECONDS = 2.0
+_last_health_check: tuple[float, dict] = (0.0, {})
+
+
+# Проверка подключения к базе данных
 @router.get("/health")
-def health_check():
-    return {"status": "ok"} 
\ No newline at end of file
+async def health_check(db: AsyncSession = Depends(get_async_db)):
+    global _last_health_check
+    checked_at, result = _last_health_check
+    now = time.monotonic()
+    if result and now - checked_at < HEALTH_CHECK_TTL_SECONDS:
+        return result
+
+    try:
+        (await db.execute(text("SELECT 1"))).scalar()
+        result = {"status": "healthy", "database": "connected"}
+    except Exception as e:
+        logger.error("Health check failed: %s", e)
+        result = {"status": "unhealthy", "database": "disconnected"}
+    _last_health_check = (now, result)
+    return result
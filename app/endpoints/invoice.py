@@ -1,6 +1,6 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app.auth.permissions import get_current_user
@@ -18,6 +18,15 @@ from app.services.financial import FinancialService
 router = APIRouter(prefix="/invoices", tags=["Invoices"])
 
 
+def _invoice_list_response(invoices, total: int) -> Response:
+    """InvoiceList из ORM-строк без повторной валидации, сразу в JSON-байты."""
+    payload = InvoiceList.model_construct(
+        items=[InvoiceResponse.from_orm_trusted(invoice) for invoice in invoices],
+        total=total,
+    )
+    return Response(content=payload.model_dump_json(), media_type="application/json")
+
+
 @router.get("/", response_model=InvoiceList)
 def get_invoices(
     client_id: Optional[int] = None,
@@ -48,7 +57,7 @@ def get_invoices(
         student_id=student_id,
         status=status,
     )
-    return {"items": invoices, "total": total_invoices}
+    return _invoice_list_response(invoices, total_invoices)
 
 
 @router.get("/{invoice_id}", response_model=InvoiceResponse)
@@ -88,7 +97,7 @@ def get_student_invoices(
         skip=skip,
         limit=limit
     )
-    return {"items": invoices, "total": len(invoices)}
+    return _invoice_list_response(invoices, len(invoices))
 
 
 @router.get("/client/{client_id}", response_model=InvoiceList)
@@ -111,7 +120,7 @@ def get_client_invoices(
         skip=skip,
         limit=limit
     )
-    return {"items": invoices, "total": len(invoices)}
+    return _invoice_list_response(invoices, len(invoices))
 
 
 @router.post("/subscription", response_model=InvoiceResponse)
@@ -1,6 +1,7 @@
 import logging
+from datetime import date
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app.auth.permissions import get_current_user
@@ -78,8 +79,8 @@ def get_payment_history(
     operation_type: str = Query(None, description="Тип операции"),
     client_id: int = Query(None, description="ID клиента"),
     created_by_id: int = Query(None, description="ID создателя операции"),
-    date_from: str = Query(None, description="Дата начала периода (YYYY-MM-DD)"),
-    date_to: str = Query(None, description="Дата окончания периода (YYYY-MM-DD)"),
+    date_from: Optional[date] = Query(None, description="Дата начала периода (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="Дата окончания периода (YYYY-MM-DD)"),
     amount_min: float = Query(None, description="Минимальная сумма"),
     amount_max: float = Query(None, description="Максимальная сумма"),
     description_search: str = Query(None, description="Поиск по описанию"),
@@ -113,13 +114,15 @@ def get_payment_history(
         filters=filters
     )
     
-    return PaymentHistoryListResponse(
+    payload = PaymentHistoryListResponse(
         items=result["items"],
         total=result["total"],
         skip=result["skip"],
         limit=result["limit"],
         has_more=result["has_more"]
-    ) 
+    )
+    # Сериализуем сразу в байты, минуя построение dict и json.dumps
+    return Response(content=payload.model_dump_json(), media_type="application/json")
 
 
 @router.delete("/{payment_id}", response_model=PaymentResponse)
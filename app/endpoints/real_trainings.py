@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from datetime import date
 from typing import Optional
@@ -60,7 +60,7 @@ def get_trainings_endpoint(
         trainer_id = current_user["id"]
 
     if with_students:
-        return get_real_trainings_with_students(
+        trainings = get_real_trainings_with_students(
             db,
             start_date=start_date,
             end_date=end_date,
@@ -69,7 +69,7 @@ def get_trainings_endpoint(
             include_cancelled=include_cancelled,
         )
     else:
-        return get_real_trainings(
+        trainings = get_real_trainings(
             db,
             start_date=start_date,
             end_date=end_date,
@@ -78,6 +78,12 @@ def get_trainings_endpoint(
             include_cancelled=include_cancelled,
         )
 
+    # Ответ собирается из ORM без from_attributes-валидации и сразу пишется в JSON
+    return Response(
+        content=RealTrainingResponse.list_json(trainings),
+        media_type="application/json",
+    )
+
 
 # Получение конкретной тренировки
 @router.get("/{training_id}", response_model=RealTrainingResponse)
@@ -100,7 +106,7 @@ def get_training_endpoint(
             detail="Тренировка не найдена"
         )
 
-    return training
+    return RealTrainingResponse.from_orm_trusted(training)
 
 
 # Создание новой тренировки
@@ -300,7 +306,7 @@ def generate_next_week_endpoint(
         return {
             "message": f"Успешно сгенерировано {created_count} тренировок",
             "created_count": created_count,
-            "trainings": [RealTrainingResponse.model_validate(training) for training in trainings],
+            "trainings": [RealTrainingResponse.from_orm_trusted(training) for training in trainings],
             "period": {
                 "start": trainings[0].training_date,
                 "end": trainings[-1].training_date
@@ -130,12 +130,14 @@ def _get_subscription_metrics(db: Session, now: datetime) -> Dict[str, Any]:
         ),
     )
 
-    active_student_subscriptions = db.query(StudentSubscription).filter(active_condition).count()
-    students_with_active_subscriptions_count = (
-        db.query(func.count(func.distinct(StudentSubscription.student_id)))
+    # Оба счетчика одним проходом по активным абонементам
+    active_student_subscriptions, students_with_active_subscriptions_count = (
+        db.query(
+            func.count(StudentSubscription.id),
+            func.count(func.distinct(StudentSubscription.student_id)),
+        )
         .filter(active_condition)
-        .scalar()
-        or 0
+        .one()
     )
 
     students_with_active_subscriptions_expr = func.count(func.distinct(Student.id))
@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.orm import Session, selectinload, undefer
 from sqlalchemy import desc
 
 from app.auth.permissions import get_current_user
@@ -42,7 +42,7 @@ def get_students_endpoint(
 
     # Получение списка студентов
     students = get_all_students(db)
-    return students
+    return Response(content=StudentResponse.list_json(students), media_type="application/json")
 
 
 # Получение студента по ID
@@ -124,7 +124,7 @@ def get_students_by_client_endpoint(
 
     # Получение списка студентов
     students = get_students_by_client_id(db, client_id)
-    return students
+    return Response(content=StudentResponse.list_json(students), media_type="application/json")
 
 
 # Получение истории платежей студента
@@ -144,7 +144,7 @@ def get_student_payments_endpoint(
     # Получаем историю платежей
     payments = db.query(PaymentHistory).filter(
         PaymentHistory.client_id == student.client_id
-    ).order_by(desc(PaymentHistory.created_at)).all()
+    ).order_by(desc(PaymentHistory.created_at), desc(PaymentHistory.id)).all()
 
     return payments
 
@@ -165,18 +165,11 @@ def get_students_by_trainer_endpoint(
     # Получаем всех активных студентов
     students = (
         db.query(Student)
+        .options(selectinload(Student.client), undefer(Student.has_unpaid_invoice))
         .filter(Student.is_active == True)
         .filter(Student.deactivation_date.is_(None))
         .order_by(Student.first_name, Student.last_name)
         .all()
     )
-    
-    # Отладка: смотрим структуру данных
-    print(f"Found {len(students)} students")
-    if students:
-        first_student = students[0]
-        print(f"First student: {first_student}")
-        print(f"First student client: {first_student.client}")
-        print(f"First student client_id: {first_student.client_id}")
-    
-    return students
\ No newline at end of file
+
+    return Response(content=StudentResponse.list_json(students), media_type="application/json")
\ No newline at end of file
@@ -57,7 +57,9 @@ def get_student_subscriptions_v2_endpoint(
     db: Session = Depends(get_db),
 ):
     """Список абонементов студента с полями v2."""
-    subs = crud_subscription.get_student_subscriptions(db, student_id=student_id)
+    subs = crud_subscription.get_student_subscriptions(
+        db, student_id=student_id, with_subscription=True
+    )
     items = []
     for sub in subs:
         item = StudentSubscriptionResponseV2.model_validate(sub)
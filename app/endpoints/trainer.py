@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
+from datetime import date, timedelta
 from typing import Optional
 
 from app.auth.permissions import get_current_user
@@ -8,6 +9,7 @@ from app.schemas.user import TrainerCreate, TrainerResponse, TrainerUpdate, Trai
 from app.schemas.payment import PaymentHistoryFilterRequest, PaymentHistoryListResponse, PaymentExtendedListResponse
 from app.crud.trainer import (create_trainer, get_trainer, get_all_trainers,
                               update_trainer, delete_trainer, update_trainer_status)
+from app.crud.user import get_user_by_email_or_phone
 from app.services.financial import FinancialService
 
 router = APIRouter(prefix="/trainers", tags=["Trainers"])
@@ -16,6 +18,14 @@ router = APIRouter(prefix="/trainers", tags=["Trainers"])
 # Создание тренера
 @router.post("/", response_model=TrainerResponse)
 def create_trainer_endpoint(trainer_data: TrainerCreate, current_user = Depends(get_current_user(["ADMIN", "OWNER"])), db: Session = Depends(get_db)):
+    # email и телефон уникальны для всех пользователей — проверяем оба одним запросом
+    existing_user = get_user_by_email_or_phone(
+        db, email=trainer_data.email, phone_number=trainer_data.phone_number
+    )
+    if existing_user:
+        if existing_user.email == trainer_data.email:
+            raise HTTPException(status_code=400, detail="User with this email already exists")
+        raise HTTPException(status_code=400, detail="User with this phone number already exists")
     return create_trainer(db, trainer_data)
 
 
@@ -23,20 +33,15 @@ def create_trainer_endpoint(trainer_data: TrainerCreate, current_user = Depends(
 @router.get("/", response_model=TrainersList)
 def get_trainers_endpoint(current_user = Depends(get_current_user(["ADMIN", "OWNER"])), db: Session = Depends(get_db)):
     trainers = get_all_trainers(db)
-    
+
     # Скрываем зарплату для не-владельцев
-    if current_user["role"] != "OWNER":
-        safe_trainers = []
-        for t in trainers:
-            # Создаем Pydantic модель из ORM объекта
-            tr = TrainerResponse.model_validate(t)
-            # Принудительно очищаем поля зарплаты
-            tr.salary = None
-            tr.is_fixed_salary = None
-            safe_trainers.append(tr)
-        return TrainersList(trainers=safe_trainers)
-        
-    return TrainersList(trainers=trainers)
+    overrides = {} if current_user["role"] == "OWNER" else {"salary": None, "is_fixed_salary": None}
+    payload = TrainersList.model_construct(
+        trainers=[TrainerResponse.from_orm_trusted(t, **overrides) for t in trainers]
+    )
+    # Тренеры собираются без model_validate на каждую строку и сериализуются
+    # сразу в байты (pydantic-core), минуя dict -> json.dumps
+    return Response(content=payload.model_dump_json(), media_type="application/json")
 
 
 # Получение тренера по ID
@@ -48,10 +53,7 @@ def get_trainer_endpoint(trainer_id: int, current_user = Depends(get_current_use
     
     # Скрываем зарплату для не-владельцев
     if current_user["role"] != "OWNER":
-        tr = TrainerResponse.model_validate(trainer)
-        tr.salary = None
-        tr.is_fixed_salary = None
-        return tr
+        return TrainerResponse.from_orm_trusted(trainer, salary=None, is_fixed_salary=None)
         
     return trainer
 
@@ -91,8 +93,8 @@ def get_trainer_payments_endpoint(
     client_id: Optional[int] = Query(None, description="ID клиента для фильтрации"),
     amount_min: Optional[float] = Query(None, description="Минимальная сумма"),
     amount_max: Optional[float] = Query(None, description="Максимальная сумма"),
-    date_from: Optional[str] = Query(None, description="Дата начала периода (YYYY-MM-DD)"),
-    date_to: Optional[str] = Query(None, description="Дата окончания периода (YYYY-MM-DD)"),
+    date_from: Optional[date] = Query(None, description="Дата начала периода (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="Дата окончания периода (YYYY-MM-DD)"),
     description_search: Optional[str] = Query(None, description="Поиск по описанию"),
     skip: int = Query(0, description="Количество записей для пропуска"),
     limit: int = Query(50, description="Максимальное количество записей"),
@@ -124,13 +126,12 @@ def get_trainer_payments_endpoint(
     
     # Добавляем логику для периода, если указан
     if period != "all":
-        from datetime import datetime, timedelta
-        today = datetime.now()
+        today = date.today()
         
         if period == "week":
-            filters.date_from = (today - timedelta(days=7)).strftime("%Y-%m-%d")
+            filters.date_from = today - timedelta(days=7)
         elif period == "2weeks":
-            filters.date_from = (today - timedelta(days=14)).strftime("%Y-%m-%d")
+            filters.date_from = today - timedelta(days=14)
 
     
     service = FinancialService(db)
@@ -155,8 +156,8 @@ def get_trainer_registered_payments_endpoint(
     client_id: Optional[int] = Query(None, description="ID клиента для фильтрации"),
     amount_min: Optional[float] = Query(None, description="Минимальная сумма"),
     amount_max: Optional[float] = Query(None, description="Максимальная сумма"),
-    date_from: Optional[str] = Query(None, description="Дата начала периода (YYYY-MM-DD)"),
-    date_to: Optional[str] = Query(None, description="Дата окончания периода (YYYY-MM-DD)"),
+    date_from: Optional[date] = Query(None, description="Дата начала периода (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="Дата окончания периода (YYYY-MM-DD)"),
     description_search: Optional[str] = Query(None, description="Поиск по описанию"),
     skip: int = Query(0, description="Количество записей для пропуска"),
     limit: int = Query(50, description="Максимальное количество записей"),
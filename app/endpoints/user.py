@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -15,7 +15,12 @@ def get_users_list(current_user=Depends(verify_jwt_token), db: Session = Depends
     """Get a list of users for autocomplete (admins only)"""
     if current_user["role"] != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Forbidden")
-    return get_all_users(db)
+    # Ответ собирается без from_attributes-валидации строк и сразу пишется
+    # в JSON, минуя dict -> json.dumps
+    return Response(
+        content=UserListResponse.list_json(get_all_users(db)),
+        media_type="application/json",
+    )
 
 
 @router.get("/me", response_model=UserMe)
@@ -25,13 +30,4 @@ def get_current_user(current_user=Depends(verify_jwt_token), db: Session = Depen
     user = get_user_by_id(db, current_user["id"])
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return UserMe(
-        id=user.id,
-        first_name=user.first_name,
-        last_name=user.last_name,
-        email=user.email,
-        phone_country_code=user.phone_country_code,
-        phone_number=user.phone_number,
-        role=user.role,
-        is_authenticated_with_google=user.is_authenticated_with_google
-    )
+    return UserMe.from_orm_trusted(user)
@@ -1,13 +1,15 @@
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 
-from fastapi import FastAPI, Depends, Request
+from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import configure_mappers
 
-from app.dependencies import get_db
 from app.auth.auth import router as auth_router
 from app.endpoints import (
     user, health, client, student, trainer, subscription, real_trainings,
@@ -16,27 +18,22 @@ from app.endpoints import (
     admin_management, client_form
 )
 from app.endpoints import subscriptions_v2, missed_sessions, system_settings, cron_v2
-from app.endpoints import client_contacts
-from app.endpoints import stats
 
-logging.basicConfig(level=logging.DEBUG) # Ensure basic config is debug
-
-# Create a logger for the application
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-
-# Create a console handler and set its level to DEBUG
-ch = logging.StreamHandler()
-ch.setLevel(logging.DEBUG)
-
-# Create a formatter and add it to the handler
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-ch.setFormatter(formatter)
-
-# Add the handler to the logger
-logger.addHandler(ch)
+# Логи пишутся в поток через очередь: обработчики запросов только кладут
+# запись в SimpleQueue, а запись в stderr делает фоновый поток QueueListener.
+# Уровень задается через LOG_LEVEL (по умолчанию WARNING)
+_log_queue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
-logger.info("Application started and logger configured.") # Test log message
+_root_logger = logging.getLogger()
+_root_logger.setLevel(getattr(logging, os.getenv("LOG_LEVEL", "WARNING").upper(), logging.WARNING))
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
 
 
 
@@ -56,71 +53,83 @@ app.add_middleware(
 )
 
 
-# Регистрация маршрутов
-app.include_router(auth_router)
-app.include_router(user.router)
-app.include_router(health.router)
-app.include_router(client.router)
-app.include_router(student.router)
-app.include_router(trainer.router)
-app.include_router(subscription.router)
-app.include_router(real_trainings.router)
-app.include_router(training_type.router)
-app.include_router(payment.router)
-app.include_router(invoice.router)
-app.include_router(cron.router)
-app.include_router(expense.router)
-app.include_router(training_template.router)
-app.include_router(training_student_template.router)
-app.include_router(trainer_salaries.router)
-app.include_router(client_contacts.router)
-app.include_router(stats.router)
-app.include_router(admin_management.router)
-app.include_router(client_form.router)
+# Регистрация маршрутов (порядок важен: при совпадении путей побеждает первый)
+ROUTERS = (
+    auth_router,
+    user.router,
+    health.router,
+    client.router,
+    student.router,
+    trainer.router,
+    subscription.router,
+    real_trainings.router,
+    training_type.router,
+    payment.router,
+    invoice.router,
+    cron.router,
+    expense.router,
+    training_template.router,
+    training_student_template.router,
+    trainer_salaries.router,
+    client_contacts.router,
+    stats.router,
+    admin_management.router,
+    client_form.router,
+    # v2 маршруты
+    subscriptions_v2.router,
+    missed_sessions.router,
+    system_settings.router,
+    cron_v2.router,
+)
+for router in ROUTERS:
+    app.include_router(router)
+
+# Все модели уже импортированы роутерами: настраиваем мапперы при старте
+# воркера, а не на первом запросе
+configure_mappers()
+
+
+
+# Ответы с постоянным телом: байты собираются один раз при импорте, а сами
+# маршруты регистрируются как обычные Starlette-маршруты — без разбора
+# зависимостей, валидации и сериализации FastAPI на каждую пробу
+_ROOT_BODY = b'{"message":"Welcome to User Management API"}'
+_HEALTHZ_BODY = b'{"message":"Healthy!"}'
+
+
+async def read_root(request: Request) -> Response:
+    return Response(_ROOT_BODY, media_type="application/json")
 
-# v2 маршруты
-app.include_router(subscriptions_v2.router)
-app.include_router(missed_sessions.router)
-app.include_router(system_settings.router)
-app.include_router(cron_v2.router)
 
+async def healthz(request: Request) -> Response:
+    return Response(_HEALTHZ_BODY, media_type="application/json")
 
 
-@app.get("/")
-def read_root():
-    return {"message": "Welcome to User Management API"}
+app.add_route("/", read_root, methods=["GET"], include_in_schema=False)
+app.add_route("/healthz", healthz, methods=["GET"], include_in_schema=False)
 
 
-@app.get("/healthz")
-async def healthz():
-    return {"message": "Healthy!"}
+def _validation_error_detail(error: dict) -> dict:
+    """Подставляет текст ValueError в msg и убирает несериализуемый ctx."""
+    ctx = error.get("ctx")
+    if ctx is not None:
+        value_error = ctx.get("error")
+        if isinstance(value_error, ValueError):
+            # Копия вместо изменения словаря из exc.errors()
+            error = {key: value for key, value in error.items() if key != "ctx"}
+            error["msg"] = str(value_error)
+    return error
 
 
 # Обработка ошибок валидации
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    errors = []
-    for error in exc.errors():
-        if 'ctx' in error and 'error' in error['ctx']:
-            # Если ошибка содержит ValueError, берем его сообщение
-            if isinstance(error['ctx']['error'], ValueError):
-                error['msg'] = str(error['ctx']['error'])
-                del error['ctx']  # Удаляем ctx, так как он содержит несериализуемые объекты
-        errors.append(error)
-    
     return JSONResponse(
         status_code=422,
-        content={"detail": errors},
+        content={"detail": [_validation_error_detail(error) for error in exc.errors()]},
     )
 
 
-# Проверка подключения к базе данных
-@app.get("/health")
-def health_check(db: Session = Depends(get_db)):
-    try:
-        # Проверяем подключение к базе данных
-        db.execute(text("SELECT 1"))
-        return {"status": "healthy", "database": "connected"}
-    except Exception as e:
-        logging.error(f"Health check failed: {str(e)}")
-        return {"status": "unhealthy", "database": "disconnected"}
+# OpenAPI-схема строится один раз при старте воркера и кешируется в
+# app.openapi_schema, а не на первом запросе к /docs или /openapi.json
+app.openapi()
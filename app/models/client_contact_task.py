@@ -1,7 +1,6 @@
-from datetime import datetime, timezone
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, Text
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, Text, func
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -19,12 +18,18 @@ class ClientContactStatus(PyEnum):
 
 class ClientContactTask(Base):
     __tablename__ = "client_contact_tasks"
+    __table_args__ = (
+        # Список задач по статусу, новые сверху
+        Index('ix_client_contact_tasks_status_created', 'status', 'created_at'),
+        # Проверка существующей задачи клиента перед созданием
+        Index('ix_client_contact_tasks_client_reason_status', 'client_id', 'reason', 'status'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     client_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     reason = Column(Enum(ClientContactReason), nullable=False)
     status = Column(Enum(ClientContactStatus), nullable=False, default=ClientContactStatus.PENDING)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     done_at = Column(DateTime(timezone=True), nullable=True)
     assigned_to_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     note = Column(Text, nullable=True)
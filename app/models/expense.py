@@ -1,5 +1,4 @@
-from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, DateTime, Text, func
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -11,8 +10,8 @@ class Expense(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     expense_type_id = Column(Integer, ForeignKey("expense_types.id"), nullable=False)
-    amount = Column(Float, nullable=False)
-    expense_date = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    amount = Column(Numeric(12, 2, asdecimal=False), nullable=False)
+    expense_date = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     description = Column(Text, nullable=True)
 
     # Relationships
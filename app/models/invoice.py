@@ -1,6 +1,5 @@
-from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Date, Float, Boolean, String, Enum as SQLEnum
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Date, Numeric, Boolean, String, Enum as SQLEnum, Index, func
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -23,6 +22,17 @@ class InvoiceType(str, Enum):
 
 class Invoice(Base):
     __tablename__ = "invoices"
+    # created_at приходит из RETURNING того же INSERT
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Инвойсы клиента по статусу (долги, автооплата)
+        Index('ix_invoices_client_status', 'client_id', 'status'),
+        # Неоплаченные инвойсы студента (Student.has_unpaid_invoice)
+        Index('ix_invoices_student_status', 'student_id', 'status'),
+        # Инвойсы за тренировку (отмены, штрафы)
+        Index('ix_invoices_training_id', 'training_id'),
+        Index('ix_invoices_created_at', 'created_at'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     client_id = Column(Integer, ForeignKey("users.id"), nullable=False)  # Клиент (плательщик)
@@ -33,13 +43,13 @@ class Invoice(Base):
 
     # Основные поля
     type = Column(SQLEnum(InvoiceType), nullable=False)  # Тип инвойса
-    amount = Column(Float, nullable=False)  # Сумма
+    amount = Column(Numeric(12, 2, asdecimal=False), nullable=False)  # Сумма
     description = Column(String, nullable=False)  # Описание/причина
     comment = Column(String, nullable=True)  # Комментарий от администратора
     
     # Статус и даты
     status = Column(SQLEnum(InvoiceStatus), nullable=False, default=InvoiceStatus.UNPAID)  # Статус
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)  # Дата создания
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())  # Дата создания
     paid_at = Column(DateTime(timezone=True), nullable=True)  # Дата оплаты
     cancelled_at = Column(DateTime(timezone=True), nullable=True)  # Дата отмены
     
@@ -53,10 +63,10 @@ class Invoice(Base):
     is_auto_renewal = Column(Boolean, default=False)  # Создан ли автоматически для автопродления
 
     # Relationships
-    client = relationship("User", foreign_keys=[client_id], backref="invoices")
-    student = relationship("Student", backref="student_invoices")
-    subscription = relationship("Subscription", backref="invoices")
-    training = relationship("RealTraining", backref="invoices")
+    client = relationship("User", foreign_keys=[client_id], back_populates="invoices")
+    student = relationship("Student", back_populates="student_invoices")
+    subscription = relationship("Subscription", back_populates="invoices")
+    training = relationship("RealTraining", back_populates="invoices")
     cancelled_by = relationship("User", foreign_keys=[cancelled_by_id])
     student_subscription = relationship("StudentSubscription", foreign_keys=[student_subscription_id])
 
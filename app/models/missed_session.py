@@ -35,12 +35,12 @@ class MissedSession(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, default=func.now())
 
     # Relationships
-    student = relationship("Student", backref="missed_sessions")
-    student_subscription = relationship("StudentSubscription", backref="missed_sessions")
+    student = relationship("Student", back_populates="missed_sessions")
+    student_subscription = relationship("StudentSubscription", back_populates="missed_sessions")
     real_training_student = relationship(
         "RealTrainingStudent",
         foreign_keys=[real_training_student_id],
-        backref="missed_session",
+        back_populates="missed_session",
     )
     made_up_real_training_student = relationship(
         "RealTrainingStudent",
@@ -1,5 +1,4 @@
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, DateTime, func
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -8,11 +7,13 @@ from app.database import Base
 class Payment(Base):
     """Модель платежа (только наличные)"""
     __tablename__ = "payments"
+    # payment_date заполняет БД; читаем его из RETURNING при INSERT
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, index=True)
     client_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    amount = Column(Float, nullable=False)
-    payment_date = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    amount = Column(Numeric(12, 2, asdecimal=False), nullable=False)
+    payment_date = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     description = Column(String, nullable=True)
     registered_by_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     cancelled_at = Column(DateTime(timezone=True), nullable=True)
@@ -20,7 +21,7 @@ class Payment(Base):
     cancellation_reason = Column(String, nullable=True)
 
     # Relationships
-    client = relationship("User", foreign_keys=[client_id], backref="payments")
+    client = relationship("User", foreign_keys=[client_id], back_populates="payments")
     registered_by = relationship("User", foreign_keys=[registered_by_id])
     cancelled_by = relationship("User", foreign_keys=[cancelled_by_id])
     payment_history = relationship("PaymentHistory", back_populates="payment", cascade="all, delete-orphan")
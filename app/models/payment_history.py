@@ -1,5 +1,4 @@
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from enum import Enum
 
@@ -16,17 +15,23 @@ class OperationType(str, Enum):
 class PaymentHistory(Base):
     """История платежей и изменений баланса"""
     __tablename__ = "payment_history"
-    
+    # created_at возвращается вместе с INSERT, без отдельного SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # История клиента, новые сверху
+        Index('ix_payment_history_client_created', 'client_id', 'created_at'),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     client_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     payment_id = Column(Integer, ForeignKey("payments.id"), nullable=True)  # Может быть null для операций с инвойсами
     invoice_id = Column(Integer, ForeignKey("invoices.id"), nullable=True)  # ID инвойса (для операций оплаты инвойса)
     operation_type = Column(String, nullable=False)  # Тип операции (payment/cancellation/invoice_payment)
-    amount = Column(Float, nullable=False)  # Сумма операции
-    balance_before = Column(Float, nullable=False)  # Баланс до операции
-    balance_after = Column(Float, nullable=False)  # Баланс после операции
+    amount = Column(Numeric(12, 2, asdecimal=False), nullable=False)  # Сумма операции
+    balance_before = Column(Numeric(12, 2, asdecimal=False), nullable=False)  # Баланс до операции
+    balance_after = Column(Numeric(12, 2, asdecimal=False), nullable=False)  # Баланс после операции
     description = Column(String, nullable=True)  # Описание операции или причина отмены
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     created_by_id = Column(Integer, ForeignKey("users.id"), nullable=False)  # Кто создал запись
 
     # Relationships
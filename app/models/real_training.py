@@ -1,5 +1,4 @@
-from datetime import datetime
-from sqlalchemy import Column, Integer, Date, Time, ForeignKey, Boolean, String, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, Integer, Date, Time, ForeignKey, Boolean, String, DateTime, Enum as SQLEnum, Index, func
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -23,6 +22,9 @@ class AttendanceStatus(str, Enum):
 
 class RealTraining(Base):
     __tablename__ = "real_trainings"
+    # created_at/updated_at считает БД; eager_defaults забирает их через
+    # RETURNING при INSERT и UPDATE, без ленивой догрузки после flush
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     training_date = Column(Date, nullable=False)
@@ -31,8 +33,8 @@ class RealTraining(Base):
     training_type_id = Column(Integer, ForeignKey("training_types.id"), nullable=False)
     template_id = Column(Integer, ForeignKey("training_templates.id"), nullable=True)
     is_template_based = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     cancelled_at = Column(DateTime, nullable=True)
     cancellation_reason = Column(String, nullable=True)
     processed_at = Column(DateTime, nullable=True)  # Время когда тренировка была обработана (процессинг)
@@ -44,6 +46,13 @@ class RealTraining(Base):
     training_type = relationship("TrainingType", back_populates="real_trainings")
     template = relationship("TrainingTemplate", back_populates="real_trainings")
     students = relationship("RealTrainingStudent", back_populates="real_training", cascade="all, delete-orphan")
+    invoices = relationship("Invoice", back_populates="training", lazy="raise")
+
+    __table_args__ = (
+        # Расписание тренера и выборки по периоду
+        Index('idx_trainer_date_time', 'responsible_trainer_id', 'training_date', 'start_time'),
+        Index('idx_real_training_date', 'training_date'),
+    )
 
 class RealTrainingStudent(Base):
     __tablename__ = "real_training_students"
@@ -68,4 +77,18 @@ class RealTrainingStudent(Base):
     student = relationship("Student", foreign_keys=[student_id], back_populates="real_trainings")
     template_student = relationship("TrainingStudentTemplate", back_populates="real_trainings")
     attendance_marked_by = relationship("User", foreign_keys=[attendance_marked_by_id])
-    subscription = relationship("StudentSubscription", back_populates="real_trainings") 
\ No newline at end of file
+    subscription = relationship("StudentSubscription", back_populates="real_trainings")
+    missed_session = relationship(
+        "MissedSession",
+        foreign_keys="MissedSession.real_training_student_id",
+        back_populates="real_training_student",
+        lazy="raise",
+    )
+
+    __table_args__ = (
+        # Тренировки студента (проверки пробной/платной, пересечения по времени)
+        Index('idx_student_training', 'student_id', 'real_training_id'),
+        # Студенты тренировки (selectinload по real_training_id)
+        Index('ix_rts_training_student', 'real_training_id', 'student_id'),
+    )
+ 
\ No newline at end of file
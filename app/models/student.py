@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, Date, Boolean, ForeignKey, DateTime
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy import Column, Integer, String, Date, Boolean, ForeignKey, DateTime, exists
+from sqlalchemy.orm import relationship, column_property
 from app.database import Base
+from app.models.invoice import Invoice, InvoiceStatus
 
 
 # Модель студента
@@ -16,12 +17,7 @@ class Student(Base):
     deactivation_date = Column(DateTime, nullable=True)
 
     # Связь с клиентом
-    client = relationship("User", backref=backref("students", passive_deletes=True))
-
-    # Связь many-to-many с абонементами через таблицу association
-    subscriptions = relationship(
-        "Subscription", secondary="student_subscriptions", backref="students", viewonly=True
-    )
+    client = relationship("User", back_populates="students")
 
     # Один активный абонемент
     active_subscription_id = Column(Integer, ForeignKey("subscriptions.id"), nullable=True)
@@ -30,22 +26,23 @@ class Student(Base):
     # Связь с реальными тренировками
     real_trainings = relationship("RealTrainingStudent", foreign_keys="RealTrainingStudent.student_id", back_populates="student")
 
+    # Обратные связи (в коде не читаются)
+    student_invoices = relationship("Invoice", back_populates="student", lazy="raise")
+    student_subscriptions = relationship("StudentSubscription", back_populates="student", lazy="raise")
+    missed_sessions = relationship("MissedSession", back_populates="student", lazy="raise")
+    training_templates = relationship("TrainingStudentTemplate", back_populates="student", lazy="raise")
+
     # Пробное занятие
     trial_used_at = Column(DateTime, nullable=True)
     trial_real_training_student_id = Column(Integer, ForeignKey("real_training_students.id"), nullable=True)
 
-    @property
-    def has_unpaid_invoice(self) -> bool:
-        """True если у студента есть хотя бы один UNPAID инвойс."""
-        from sqlalchemy.orm import object_session
-        from app.models.invoice import Invoice, InvoiceStatus
-        session = object_session(self)
-        if not session:
-            return False
-        return session.query(Invoice).filter(
-            Invoice.student_id == self.id,
-            Invoice.status == InvoiceStatus.UNPAID,
-        ).first() is not None
+    # True если у студента есть хотя бы один UNPAID инвойс.
+    # Отложенная колонка: списки подгружают ее через undefer() в том же
+    # SELECT, вместо отдельного запроса на каждого студента
+    has_unpaid_invoice = column_property(
+        exists().where(Invoice.student_id == id, Invoice.status == InvoiceStatus.UNPAID),
+        deferred=True,
+    )
 
     def __repr__(self):
         return f"<Student(id={self.id}, first_name={self.first_name}, last_name={self.last_name})>"
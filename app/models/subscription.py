@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, DateTime, Date, case, func
+from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, DateTime, Date, Index, and_, case, func, or_
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.hybrid import hybrid_property
 
@@ -19,6 +19,10 @@ class Subscription(Base):
     # v2: лимит тренировок в неделю (number_of_sessions/validity_days остаются до Фазы 2)
     sessions_per_week = Column(Integer, nullable=True)
 
+    # Обратные связи (в коде не читаются)
+    invoices = relationship("Invoice", back_populates="subscription", lazy="raise")
+    student_subscriptions = relationship("StudentSubscription", back_populates="subscription", lazy="raise")
+
 
 # Ассоциативная таблица для связи студентов и абонементов
 class StudentSubscription(Base):
@@ -50,34 +54,53 @@ class StudentSubscription(Base):
     auto_renewal_invoice_id = Column(Integer, ForeignKey("invoices.id"), nullable=True)  # Инвойс на автопродление
 
     # Relationships
-    student = relationship("Student", backref="student_subscriptions")
-    subscription = relationship("Subscription", backref="student_subscriptions")
-    auto_renewal_invoice = relationship("Invoice", foreign_keys=[auto_renewal_invoice_id])
-    real_trainings = relationship("RealTrainingStudent", back_populates="subscription")
-
-    @hybrid_property
-    def status(self):
-        """Вычисляет статус абонемента с учетом временных зон"""
-        current_time = datetime.now(timezone.utc)  # Используем timezone-aware datetime
-
+    student = relationship("Student", back_populates="student_subscriptions")
+    subscription = relationship("Subscription", back_populates="student_subscriptions")
+    auto_renewal_invoice = relationship("Invoice", foreign_keys=[auto_renewal_invoice_id], lazy="raise_on_sql")
+    real_trainings = relationship("RealTrainingStudent", back_populates="subscription", lazy="raise_on_sql")
+    missed_sessions = relationship("MissedSession", back_populates="student_subscription", lazy="raise")
+
+    __table_args__ = (
+        # Поиск действующего абонемента студента: student_id + диапазон по end_date
+        Index(
+            'idx_student_end_date', 'student_id', 'end_date',
+            postgresql_include=['subscription_id', 'sessions_left'],
+        ),
+    )
+
+    def status_at(self, moment: datetime) -> str:
+        """
+        Статус абонемента на момент moment (timezone-aware).
+
+        При обходе списка абонементов передавайте один общий moment, чтобы не
+        вызывать datetime.now() на каждой строке.
+        """
         # v2: расписание ещё не настроено
         if self.schedule_confirmed_at is None:
             return "pending_schedule"
 
         # Проверяем, что подписка ещё не началась (для автопродления)
-        if current_time < self.start_date:
+        if moment < self.start_date:
             return "pending"
-        
-        if (self.freeze_start_date and self.freeze_end_date and
-            current_time >= self.freeze_start_date and
-            current_time <= self.freeze_end_date):
-            return "frozen"
-        
-        if current_time > self.end_date:
+
+        # У большинства абонементов заморозки нет: freeze_end_date читаем,
+        # только если задано начало
+        freeze_start = self.freeze_start_date
+        if freeze_start is not None and freeze_start <= moment:
+            freeze_end = self.freeze_end_date
+            if freeze_end is not None and moment <= freeze_end:
+                return "frozen"
+
+        if moment > self.end_date:
             return "expired"
-        
+
         return "active"
 
+    @hybrid_property
+    def status(self):
+        """Вычисляет статус абонемента с учетом временных зон"""
+        return self.status_at(datetime.now(timezone.utc))
+
     @status.expression
     def status(cls):
         """SQL expression для status с учетом временных зон"""
@@ -98,6 +121,26 @@ class StudentSubscription(Base):
             else_="active"
         )
 
+    @classmethod
+    def active_clause(cls, moment=None):
+        """
+        Условие status == 'active' без CASE: простые сравнения по колонкам,
+        которые БД может использовать с индексами (status.expression — нет).
+        """
+        if moment is None:
+            moment = func.now()
+        return and_(
+            cls.schedule_confirmed_at.isnot(None),
+            cls.start_date <= moment,
+            cls.end_date >= moment,
+            or_(
+                cls.freeze_start_date.is_(None),
+                cls.freeze_end_date.is_(None),
+                cls.freeze_start_date > moment,
+                cls.freeze_end_date < moment,
+            ),
+        )
+
     @hybrid_property
     def computed_end_date(self):
         """Пересчитанная дата окончания, добавляющая замороженные дни."""
@@ -13,8 +13,9 @@ class TrainerTrainingTypeSalary(Base):
     training_type_id = Column(Integer, ForeignKey("training_types.id"), nullable=False)
     salary = Column(Float, nullable=False)
 
-    trainer = relationship("User", back_populates="training_type_salaries")
-    training_type = relationship("TrainingType", back_populates="trainer_salaries")
+    # В коде не читаются; ленивый SELECT здесь — ошибка, нужен явный options()
+    trainer = relationship("User", back_populates="training_type_salaries", lazy="raise_on_sql")
+    training_type = relationship("TrainingType", back_populates="trainer_salaries", lazy="raise_on_sql")
 
     __table_args__ = (
         UniqueConstraint(
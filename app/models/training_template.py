@@ -16,8 +16,8 @@ class TrainingStudentTemplate(Base):
     student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
 
     linked_training_template = relationship("TrainingTemplate", back_populates="assigned_students")
-    student = relationship("Student", backref="training_templates")
-    real_trainings = relationship("RealTrainingStudent", back_populates="template_student")
+    student = relationship("Student", back_populates="training_templates")
+    real_trainings = relationship("RealTrainingStudent", back_populates="template_student", lazy="raise_on_sql")
 
 
 class TrainingTemplate(Base):
@@ -32,12 +32,14 @@ class TrainingTemplate(Base):
     is_deleted = Column(Boolean, default=False, nullable=False)
 
     assigned_students = relationship("TrainingStudentTemplate", back_populates="linked_training_template")
-    training_type = relationship("TrainingType", backref="training_templates")
-    responsible_trainer = relationship("User", backref="training_templates")
-    real_trainings = relationship("RealTraining", back_populates="template")
+    training_type = relationship("TrainingType", back_populates="training_templates")
+    responsible_trainer = relationship("User", back_populates="training_templates")
+    real_trainings = relationship("RealTraining", back_populates="template", lazy="raise_on_sql")
 
     __table_args__ = (
         Index('idx_day_time', 'day_number', 'start_time'),
+        # Проверка конфликтов расписания тренера (тренер + день + время)
+        Index('ix_training_templates_trainer_day_time', 'responsible_trainer_id', 'day_number', 'start_time'),
     )
 
 
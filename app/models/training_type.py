@@ -27,8 +27,9 @@ class TrainingType(Base):
     safe_cancel_hours = Column(Integer, nullable=True, server_default=text('24'))
 
     # Relationships
-    real_trainings = relationship("RealTraining", back_populates="training_type")
-    trainer_salaries = relationship("TrainerTrainingTypeSalary", back_populates="training_type")
+    real_trainings = relationship("RealTraining", back_populates="training_type", lazy="raise_on_sql")
+    trainer_salaries = relationship("TrainerTrainingTypeSalary", back_populates="training_type", lazy="raise_on_sql")
+    training_templates = relationship("TrainingTemplate", back_populates="training_type", lazy="raise")
 
     def __repr__(self):
         return f"<TrainingType(id={self.id}, name={self.name}, subscription_only={self.is_subscription_only}, is_active={self.is_active})>"
\ No newline at end of file
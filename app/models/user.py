@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Boolean, Enum, Float, DateTime
+from sqlalchemy import Column, Integer, String, Date, Boolean, Enum, Float, DateTime, Index, text
 from sqlalchemy.orm import validates, relationship
 from app.database import Base
 from enum import Enum as PyEnum
@@ -15,8 +15,14 @@ class UserRole(PyEnum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Списки пользователей по роли с сортировкой по имени
+        Index("ix_users_role_name", "role", "first_name", "last_name", "id"),
+        # Активные пользователи роли (активные тренеры/админы)
+        Index("ix_users_role_active", "role", postgresql_where=text("is_active = true")),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     first_name = Column(String, nullable=False)  # Имя пользователя
     last_name = Column(String, nullable=False)  # Фамилия пользователя
     date_of_birth = Column(Date, nullable=False)  # Дата рождения
@@ -42,9 +48,14 @@ class User(Base):
     deactivation_date = Column(DateTime, nullable=True)
 
     # Relationships
-    real_trainings = relationship("RealTraining", back_populates="trainer")
-    expenses = relationship("Expense", back_populates="user")
-    training_type_salaries = relationship("TrainerTrainingTypeSalary", back_populates="trainer")
+    real_trainings = relationship("RealTraining", back_populates="trainer", lazy="raise_on_sql")
+    expenses = relationship("Expense", back_populates="user", lazy="raise_on_sql")
+    training_type_salaries = relationship("TrainerTrainingTypeSalary", back_populates="trainer", lazy="raise_on_sql")
+    # Обратные связи (в коде не читаются)
+    students = relationship("Student", back_populates="client", passive_deletes=True, lazy="raise")
+    invoices = relationship("Invoice", foreign_keys="Invoice.client_id", back_populates="client", lazy="raise")
+    payments = relationship("Payment", foreign_keys="Payment.client_id", back_populates="client", lazy="raise")
+    training_templates = relationship("TrainingTemplate", back_populates="responsible_trainer", lazy="raise")
 
     # Валидация: WhatsApp только для клиентов
     @validates("whatsapp_number", "whatsapp_country_code")
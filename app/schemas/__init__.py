@@ -1,6 +1,6 @@
 from .user import UserRole, UserBase, ClientCreate, ClientUpdate, ClientResponse, TrainerCreate, TrainerUpdate, TrainerResponse, TrainersList, UserDelete, UserMe, StatusUpdate, ClientStatusResponse, StudentStatusResponse, UserListResponse, AdminCreate, AdminUpdate, AdminResponse, AdminStatusUpdate, AdminsList, UserUpdate
 from .expense import ExpenseBase, ExpenseCreate, Expense, ExpenseTypeBase, ExpenseTypeCreate, ExpenseType
-from .real_training import StudentCancellationRequest, RealTrainingBase, RealTrainingCreate, RealTrainingUpdate, RealTrainingResponse, TrainingCancellationRequest, StudentCancellationResponse, RealTrainingStudentCreate, RealTrainingStudentUpdate
+from .real_training import StudentCancellationRequest, RealTrainingBase, RealTrainingCreate, RealTrainingUpdate, RealTrainingResponse, TrainingCancellationRequest, StudentCancellationResponse
 from .subscription import SubscriptionBase, SubscriptionCreate, SubscriptionUpdate, SubscriptionResponse, StudentSubscriptionBase, StudentSubscriptionCreate, StudentSubscriptionUpdate, StudentSubscriptionResponse, SubscriptionFreeze, SubscriptionList
 from .training_template import TrainingTemplateBase, TrainingTemplateCreate, TrainingTemplateUpdate, TrainingStudentTemplateBase, TrainingStudentTemplateCreate, TrainingStudentTemplateUpdate, TrainingStudentTemplateResponse, TrainingTemplateResponse
 from .client_contact_task import ClientContactReason, ClientContactStatus, ClientContactTaskCreate, ClientContactTaskUpdate, ClientContactTaskResponse
@@ -9,5 +9,5 @@ from .trainer_training_type_salary import TrainerTrainingTypeSalaryBase, Trainer
 from .training_type import TrainingTypeBase, TrainingTypeCreate, TrainingTypeUpdate, TrainingTypeResponse, TrainingTypesList
 from .real_training_student import RealTrainingStudentCreate, RealTrainingStudentUpdate, RealTrainingStudentResponse
 from .student import StudentBase, StudentCreateWithoutClient, StudentCreate, StudentUser, StudentUpdate, StudentResponse
-from .payment import PaymentBase, PaymentCreate, PaymentUpdate, PaymentUpdate, PaymentResponse, PaymentExtendedResponse, ClientBalanceResponse, PaymentHistoryResponse, PaymentHistoryFilterRequest, PaymentHistoryExtendedResponse, PaymentHistoryListResponse, PaymentListResponse, PaymentExtendedListResponse
+from .payment import PaymentBase, PaymentCreate, PaymentUpdate, PaymentResponse, PaymentExtendedResponse, ClientBalanceResponse, PaymentHistoryResponse, PaymentHistoryFilterRequest, PaymentHistoryExtendedResponse, PaymentHistoryListResponse, PaymentListResponse, PaymentExtendedListResponse
 from .invoice import UserBasic, InvoiceBase, InvoiceCreate, SubscriptionInvoiceCreate, TrainingInvoiceCreate, InvoiceResponse, InvoiceUpdate, InvoiceList
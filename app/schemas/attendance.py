@@ -1,14 +1,5 @@
-from enum import Enum
+# Единственное определение статусов посещения живет в модели: схемы и ORM
+# используют один и тот же Enum-класс
+from app.models.real_training import AttendanceStatus
 
-class AttendanceStatus(str, Enum):
-    # Базовые статусы посещения
-    PRESENT = "PRESENT"              # Присутствовал
-    ABSENT = "ABSENT"                # Отсутствовал (не пришел)
-    
-    # Статусы отмены
-    CANCELLED_SAFE = "CANCELLED_SAFE"         # Отменен своевременно (>12ч, без штрафа)
-    CANCELLED_PENALTY = "CANCELLED_PENALTY"   # Отменен поздно (<12ч, со штрафом)
-    
-    # Дополнительные статусы
-    REGISTERED = "REGISTERED"        # Зарегистрирован, ждет тренировки
-    WAITLIST = "WAITLIST"           # В листе ожидания (если есть ограничения) 
\ No newline at end of file
+__all__ = ["AttendanceStatus"]
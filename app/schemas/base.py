@@ -0,0 +1,136 @@
+from enum import Enum
+from types import UnionType
+from typing import Any, ClassVar, Iterable, Optional, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+
+def _enum_type(annotation: Any) -> type[Enum] | None:
+    """Возвращает Enum-класс из аннотации поля (в т.ч. из Optional[Enum])."""
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return annotation
+    if get_origin(annotation) in (Union, UnionType):
+        for arg in get_args(annotation):
+            enum_cls = _enum_type(arg)
+            if enum_cls is not None:
+                return enum_cls
+    return None
+
+
+def _nested_trusted_type(annotation: Any) -> tuple[type["TrustedORMModel"], bool] | None:
+    """
+    Возвращает (схема, is_list) для полей-вложенных TrustedORMModel:
+    X, Optional[X], List[X] и Optional[List[X]].
+    """
+    if isinstance(annotation, type) and issubclass(annotation, TrustedORMModel):
+        return annotation, False
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        for arg in get_args(annotation):
+            nested = _nested_trusted_type(arg)
+            if nested is not None:
+                return nested
+    elif origin is list:
+        args = get_args(annotation)
+        if args and isinstance(args[0], type) and issubclass(args[0], TrustedORMModel):
+            return args[0], True
+    return None
+
+
+class TrustedORMModel(BaseModel):
+    """
+    Базовая схема ответа, которую можно собрать из ORM-объекта без валидации.
+
+    Строки из БД уже прошли проверку при записи, поэтому для ответов
+    используется model_construct вместо model_validate. Валидация остается
+    только на входе HTTP (схемы *Create / *Update).
+    """
+
+    _trusted_enum_fields: ClassVar[dict[str, type[Enum]]] = {}
+    _trusted_nested_fields: ClassVar[dict[str, tuple[type["TrustedORMModel"], bool]]] = {}
+    # Enum-класс -> {значение: член}; общий для всех схем
+    _enum_members_by_value: ClassVar[dict[type[Enum], dict[Any, Enum]]] = {}
+    _list_adapter: ClassVar[Optional[TypeAdapter]] = None
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # Enum-поля считаем один раз на класс: модели БД и схемы используют
+        # разные Enum-классы с одинаковыми значениями
+        cls._trusted_enum_fields = {
+            name: enum_cls
+            for name, field in cls.model_fields.items()
+            if (enum_cls := _enum_type(field.annotation)) is not None
+        }
+        # Вложенные схемы собираются тем же способом, рекурсивно
+        cls._trusted_nested_fields = {
+            name: nested
+            for name, field in cls.model_fields.items()
+            if (nested := _nested_trusted_type(field.annotation)) is not None
+        }
+        # Таблица значение -> член, чтобы на каждой строке был поиск в dict,
+        # а не вызов EnumMeta.__call__
+        for enum_cls in cls._trusted_enum_fields.values():
+            if enum_cls not in TrustedORMModel._enum_members_by_value:
+                TrustedORMModel._enum_members_by_value[enum_cls] = {
+                    member.value: member for member in enum_cls
+                }
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any, **overrides: Any):
+        """Собирает схему из атрибутов ORM-объекта без повторной валидации."""
+        return cls._build_trusted(obj, overrides, {})
+
+    @classmethod
+    def _build_trusted(cls, obj: Any, overrides: dict[str, Any], memo: dict):
+        data = {}
+        for name, field in cls.model_fields.items():
+            if name in overrides:
+                value = overrides[name]
+            elif field.is_required():
+                value = getattr(obj, name, None)
+            else:
+                value = getattr(obj, name, field.get_default(call_default_factory=True))
+
+            if value is not None and name not in overrides:
+                nested = cls._trusted_nested_fields.get(name)
+                enum_cls = cls._trusted_enum_fields.get(name)
+                if nested is not None:
+                    schema, is_list = nested
+                    if is_list:
+                        value = [schema._nested_trusted(item, memo) for item in value]
+                    else:
+                        value = schema._nested_trusted(value, memo)
+                elif enum_cls is not None and not isinstance(value, enum_cls):
+                    raw = getattr(value, "value", value)
+                    member = cls._enum_members_by_value[enum_cls].get(raw)
+                    value = member if member is not None else enum_cls(raw)
+            data[name] = value
+        return cls.model_construct(**data)
+
+    @classmethod
+    def _nested_trusted(cls, obj: Any, memo: dict):
+        # identity map сессии отдает один и тот же ORM-объект для одной строки
+        # (например, студент в нескольких тренировках), поэтому в пределах
+        # одной сборки вложенная схема строится один раз на объект
+        key = (cls, id(obj))
+        built = memo.get(key)
+        if built is None:
+            built = memo[key] = cls._build_trusted(obj, {}, memo)
+        return built
+
+    @classmethod
+    def list_json(cls, objs: Iterable[Any], **overrides: Any) -> bytes:
+        """
+        JSON-байты списка ORM-объектов без валидации.
+
+        Возвращать результат нужно через Response. Готовые модели FastAPI
+        повторно не валидирует, но так экономится from_attributes-валидация
+        ORM-строк и проход dict -> json.dumps при сериализации ответа.
+        """
+        adapter = cls.__dict__.get("_list_adapter")
+        if adapter is None:
+            adapter = TypeAdapter(list[cls])
+            cls._list_adapter = adapter
+        memo: dict = {}
+        return adapter.dump_json([cls._build_trusted(obj, overrides, memo) for obj in objs])
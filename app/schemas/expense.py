@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional
 
@@ -21,8 +21,7 @@ class ExpenseUpdate(BaseModel):
 class Expense(ExpenseBase):
     id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ExpenseTypeBase(BaseModel):
     name: str
@@ -34,5 +33,4 @@ class ExpenseTypeCreate(ExpenseTypeBase):
 class ExpenseType(ExpenseTypeBase):
     id: int
 
-    class Config:
-        orm_mode = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
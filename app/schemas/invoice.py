@@ -1,18 +1,19 @@
 from datetime import datetime
 from typing import Optional, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 from app.models import InvoiceType, InvoiceStatus
+from app.schemas.base import TrustedORMModel
 
 
-class UserBasic(BaseModel):
+class UserBasic(TrustedORMModel):
     """Basic user information for invoice responses"""
     id: int
     first_name: str
     last_name: str
     
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class InvoiceBase(BaseModel):
@@ -32,6 +33,8 @@ class InvoiceCreate(InvoiceBase):
     status: InvoiceStatus = Field(InvoiceStatus.UNPAID, description="Статус инвойса")
     student_subscription_id: Optional[int] = Field(None, description="ID подписки студента")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class SubscriptionInvoiceCreate(InvoiceBase):
     """Схема для создания инвойса для абонемента"""
@@ -43,7 +46,7 @@ class TrainingInvoiceCreate(InvoiceBase):
     training_id: int = Field(..., description="ID тренировки")
 
 
-class InvoiceResponse(BaseModel):
+class InvoiceResponse(TrustedORMModel):
     """Схема ответа с информацией об инвойсе"""
     id: int
     client_id: int
@@ -64,7 +67,7 @@ class InvoiceResponse(BaseModel):
     # Include client information
     client: Optional[UserBasic] = None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class InvoiceUpdate(BaseModel):
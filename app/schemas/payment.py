@@ -1,6 +1,6 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator, ConfigDict
 from app.models.payment_history import OperationType
 
 
@@ -14,13 +14,15 @@ class PaymentCreate(PaymentBase):
     """Схема для создания платежа"""
     client_id: int = Field(..., description="ID клиента")
 
-    @validator('amount')
+    @field_validator('amount')
+    @classmethod
     def amount_must_be_positive(cls, v):
         if v <= 0:
             raise ValueError('Amount must be positive')
         return v
 
-    @validator('description')
+    @field_validator('description')
+    @classmethod
     def description_must_be_less_than_500_characters(cls, v):
         if len(v) > 500:
             raise ValueError('Description must be less than 500 characters')
@@ -31,11 +33,8 @@ class PaymentUpdate(BaseModel):
     amount: Optional[float] = Field(None, description="Сумма платежа")
     description: Optional[str] = Field(None, description="Описание платежа")
 
-
-class PaymentUpdate(BaseModel):
-    """Схема для обновления платежа"""
-    amount: Optional[float] = Field(None, description="Сумма платежа")
-    description: Optional[str] = Field(None, description="Описание платежа")
+    # Схема не участвует в маршрутах: core-схема строится при первом использовании
+    model_config = ConfigDict(defer_build=True)
 
 
 class PaymentResponse(PaymentBase):
@@ -47,7 +46,7 @@ class PaymentResponse(PaymentBase):
     cancelled_at: Optional[datetime] = None
     cancelled_by_id: Optional[int] = None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaymentExtendedResponse(PaymentBase):
@@ -65,7 +64,7 @@ class PaymentExtendedResponse(PaymentBase):
     registered_by_first_name: Optional[str] = None
     registered_by_last_name: Optional[str] = None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ClientBalanceResponse(BaseModel):
@@ -73,7 +72,7 @@ class ClientBalanceResponse(BaseModel):
     client_id: int
     balance: float
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaymentHistoryResponse(BaseModel):
@@ -88,7 +87,7 @@ class PaymentHistoryResponse(BaseModel):
     created_at: datetime
     created_by_id: int
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Новые схемы для страницы лога транзакций
@@ -97,14 +96,16 @@ class PaymentHistoryFilterRequest(BaseModel):
     operation_type: Optional[str] = Field(None, description="Тип операции")
     client_id: Optional[int] = Field(None, description="ID клиента")
     created_by_id: Optional[int] = Field(None, description="ID создателя операции")
-    date_from: Optional[str] = Field(None, description="Дата начала периода (YYYY-MM-DD)")
-    date_to: Optional[str] = Field(None, description="Дата окончания периода (YYYY-MM-DD)")
+    date_from: Optional[date] = Field(None, description="Дата начала периода (YYYY-MM-DD)")
+    date_to: Optional[date] = Field(None, description="Дата окончания периода (YYYY-MM-DD)")
     amount_min: Optional[float] = Field(None, description="Минимальная сумма")
     amount_max: Optional[float] = Field(None, description="Максимальная сумма")
     description_search: Optional[str] = Field(None, description="Поиск по описанию")
     skip: int = Field(0, description="Количество записей для пропуска")
     limit: int = Field(100, description="Максимальное количество записей")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PaymentHistoryExtendedResponse(BaseModel):
     """Расширенная схема ответа с информацией о связанных объектах"""
@@ -127,7 +128,7 @@ class PaymentHistoryExtendedResponse(BaseModel):
     created_by_last_name: Optional[str] = None
     payment_description: Optional[str] = None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaymentHistoryListResponse(BaseModel):
@@ -138,7 +139,7 @@ class PaymentHistoryListResponse(BaseModel):
     limit: int
     has_more: bool
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaymentListResponse(BaseModel):
@@ -149,7 +150,7 @@ class PaymentListResponse(BaseModel):
     limit: int
     has_more: bool
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class PaymentExtendedListResponse(BaseModel):
@@ -160,4 +161,4 @@ class PaymentExtendedListResponse(BaseModel):
     limit: int
     has_more: bool
 
-    model_config = {"from_attributes": True} 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True) 
\ No newline at end of file
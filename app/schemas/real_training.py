@@ -3,6 +3,7 @@ from typing import Optional, List
 from app.schemas.user import TrainerResponse
 from app.schemas.training_type import TrainingTypeResponse
 from pydantic import BaseModel, ConfigDict
+from app.schemas.base import TrustedORMModel
 from app.schemas.real_training_student import RealTrainingStudentResponse, RealTrainingStudentCreate
 
 
@@ -13,7 +14,7 @@ class StudentCancellationRequest(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class RealTrainingBase(BaseModel):
+class RealTrainingBase(TrustedORMModel):
     id: int
     training_date: date
     start_time: time
@@ -71,15 +72,7 @@ class StudentCancellationResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-
-
-
-class RealTrainingStudentUpdate(BaseModel):
-    """Схема для обновления записи студента на тренировку"""
-    status: Optional[str] = None
-    cancellation_reason: Optional[str] = None
-
-    model_config = ConfigDict(from_attributes=True)
-
 class RealTrainingWithTrialStudentCreate(RealTrainingCreate):
-    student_id: int
\ No newline at end of file
+    student_id: int
+
+    model_config = ConfigDict(defer_build=True)
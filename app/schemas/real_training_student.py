@@ -1,9 +1,10 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator, ConfigDict
 
 from app.models.real_training import AttendanceStatus
+from app.schemas.base import TrustedORMModel
 from app.schemas.student import StudentResponse
 
 
@@ -17,7 +18,8 @@ class RealTrainingStudentUpdate(BaseModel):
     status: Optional[AttendanceStatus] = Field(None, description="Статус посещения")
     cancellation_reason: Optional[str] = Field(None, description="Причина отмены")
 
-    @validator("status")
+    @field_validator("status")
+    @classmethod
     def prevent_present_status(cls, v):
         if v == AttendanceStatus.PRESENT:
             raise ValueError(
@@ -25,13 +27,10 @@ class RealTrainingStudentUpdate(BaseModel):
             )
         return v
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-from app.schemas.student import StudentResponse
-
-class RealTrainingStudentResponse(BaseModel):
+class RealTrainingStudentResponse(TrustedORMModel):
     real_training_id: int
     student_id: int
     status: Optional[AttendanceStatus] = None
@@ -41,5 +40,4 @@ class RealTrainingStudentResponse(BaseModel):
     student: Optional[StudentResponse] = None
     is_trial: bool
 
-    class Config:
-        from_attributes = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -1,20 +1,18 @@
-from pydantic import BaseModel, validator, computed_field
+from pydantic import BaseModel, field_validator, computed_field, ConfigDict
 from datetime import date, datetime
-from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    pass
+from app.schemas.base import TrustedORMModel
 
 
 # Базовая схема (поля для всех студентов)
-class StudentBase(BaseModel):
+class StudentBase(TrustedORMModel):
     id: int
     first_name: str
     last_name: str
     date_of_birth: date
     is_active: bool
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Схема для создания студента без привязки к клиенту
@@ -23,7 +21,8 @@ class StudentCreateWithoutClient(BaseModel):
     last_name: str
     date_of_birth: date
 
-    @validator('date_of_birth')
+    @field_validator('date_of_birth')
+    @classmethod
     def validate_birth_date(cls, v):
         if v > date.today():
             raise ValueError("Дата рождения не может быть в будущем")
@@ -38,14 +37,15 @@ class StudentCreate(BaseModel):
     is_active: bool = True
     client_id: int  # ID клиента (связь с пользователем)
 
-    @validator('date_of_birth')
+    @field_validator('date_of_birth')
+    @classmethod
     def validate_birth_date(cls, v):
         if v > date.today():
             raise ValueError("Дата рождения не может быть в будущем")
         return v
 
 
-class StudentUser(BaseModel):
+class StudentUser(TrustedORMModel):
     id: int
     first_name: str
     last_name: str
@@ -54,7 +54,7 @@ class StudentUser(BaseModel):
     email: str
     balance: float | None = None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
     
     @computed_field
     @property
@@ -71,7 +71,8 @@ class StudentUpdate(BaseModel):
     is_active: bool | None = None
     client_id: int | None = None  # Возможность изменять связь с клиентом
 
-    @validator('date_of_birth')
+    @field_validator('date_of_birth')
+    @classmethod
     def validate_birth_date(cls, v):
         if v and v > date.today():
             raise ValueError("Дата рождения не может быть в будущем")
@@ -86,5 +87,5 @@ class StudentResponse(StudentBase):
     has_unpaid_invoice: bool = False  # True если есть UNPAID инвойс
     trial_used_at: datetime | None = None  # Когда использовал пробное занятие
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
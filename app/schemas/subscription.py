@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class SubscriptionBase(BaseModel):
@@ -33,7 +33,7 @@ class SubscriptionResponse(SubscriptionBase):
     """Схема ответа с информацией об абонементе"""
     id: int
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class StudentSubscriptionBase(BaseModel):
@@ -75,7 +75,7 @@ class StudentSubscriptionResponse(StudentSubscriptionBase):
     auto_renewal_invoice_id: Optional[int] = None
     status: str
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SubscriptionFreeze(BaseModel):
@@ -2,7 +2,7 @@
 from datetime import date, datetime
 from typing import Optional, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 # ---------------------------------------------------------------------------
@@ -17,7 +17,7 @@ class SubscriptionResponseV2(BaseModel):
     sessions_per_week: Optional[int] = None
     is_active: bool
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # ---------------------------------------------------------------------------
@@ -53,7 +53,7 @@ class StudentSubscriptionResponseV2(BaseModel):
     # Legacy поля (оставлены для backward compat фронта)
     sessions_left: Optional[int] = None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class StudentSubscriptionListV2(BaseModel):
@@ -78,7 +78,7 @@ class MissedSessionResponse(BaseModel):
     made_up_real_training_student_id: Optional[int] = None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MissedSessionList(BaseModel):
@@ -95,7 +95,7 @@ class SystemSettingResponse(BaseModel):
     value: str
     updated_at: Optional[datetime] = None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SystemSettingUpdate(BaseModel):
@@ -120,4 +120,4 @@ class TemplateAddStudentResponse(BaseModel):
     subscription_activated: bool = False
     subscription_sessions_left_to_add: Optional[int] = None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
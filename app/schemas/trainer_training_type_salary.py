@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import date, time
 from typing import List, Optional
 
@@ -20,8 +20,7 @@ class TrainerTrainingTypeSalaryUpdate(BaseModel):
 class TrainerTrainingTypeSalaryResponse(TrainerTrainingTypeSalaryBase):
     id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SalaryPreviewTraining(BaseModel):
@@ -39,8 +38,7 @@ class TrainerSalaryPreviewResponse(BaseModel):
     potential_total_amount: float
     eligible_trainings: List[SalaryPreviewTraining]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SalaryFinalizationResponse(BaseModel):
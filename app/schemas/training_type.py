@@ -2,9 +2,11 @@ from pydantic import BaseModel, Field, field_validator, ConfigDict
 from typing import Optional
 from datetime import time
 
+from app.schemas.base import TrustedORMModel
+
 
 # Обобщенная схема для TrainingType
-class TrainingTypeBase(BaseModel):
+class TrainingTypeBase(TrustedORMModel):
     id: int
     name: str
     is_subscription_only: bool
@@ -22,7 +24,7 @@ class TrainingTypeBase(BaseModel):
     # Flexible mode
     safe_cancel_hours: Optional[int] = None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Схема для создания нового типа тренировки
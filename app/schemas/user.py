@@ -1,6 +1,7 @@
-from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator, ConfigDict
 from datetime import date, datetime
 from enum import Enum
+from app.schemas.base import TrustedORMModel
 from app.schemas.student import StudentCreateWithoutClient
 import re
 
@@ -13,7 +14,7 @@ class UserRole(str, Enum):
 
 
 # General base schema (fields for all users)
-class UserBase(BaseModel):
+class UserBase(TrustedORMModel):
     id: int
     first_name: str
     last_name: str
@@ -24,7 +25,7 @@ class UserBase(BaseModel):
     role: UserRole
     is_authenticated_with_google: bool
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ClientCreate(BaseModel):
@@ -160,7 +161,10 @@ class TrainersList(BaseModel):
 class UserDelete(BaseModel):
     id: int
 
-class UserMe(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+
+class UserMe(TrustedORMModel):
     id: int
     first_name: str
     last_name: str
@@ -169,7 +173,7 @@ class UserMe(BaseModel):
     phone_number: str
     role: UserRole
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 class StatusUpdate(BaseModel):
     is_active: bool
@@ -180,7 +184,7 @@ class ClientStatusResponse(BaseModel):
     deactivation_date: datetime | None
     affected_students_count: int | None = Field(None, description="Number of affected students in case of cascading changes")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 class StudentStatusResponse(BaseModel):
     id: int
@@ -188,9 +192,9 @@ class StudentStatusResponse(BaseModel):
     deactivation_date: datetime | None
     client_status: bool = Field(..., description="Parent client status")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
-class UserListResponse(BaseModel):
+class UserListResponse(TrustedORMModel):
     """Schema for user list in autocomplete"""
     id: int
     first_name: str
@@ -198,7 +202,7 @@ class UserListResponse(BaseModel):
     email: EmailStr
     role: UserRole
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Admin Management Schemas
@@ -296,6 +300,8 @@ class UserUpdate(BaseModel):
     salary: float | None = Field(None, ge=0)
     is_fixed_salary: bool | None = None
 
+    model_config = ConfigDict(defer_build=True)
+
     @field_validator('date_of_birth')
     @classmethod
     def validate_birth_date(cls, v: date | None) -> date | None:
@@ -70,7 +70,7 @@ class ClientContactService:
             q = q.filter(ClientContactTask.reason == reason)
         if assigned_to_id is not None:
             q = q.filter(ClientContactTask.assigned_to_id == assigned_to_id)
-        return q.order_by(ClientContactTask.created_at.desc()).offset(offset).limit(limit).all()
+        return q.order_by(ClientContactTask.created_at.desc(), ClientContactTask.id.desc()).offset(offset).limit(limit).all()
 
     def create_task_on_new_client(self, client_id: int) -> ClientContactTask:
         return self.create_task(client_id=client_id, reason=ClientContactReason.NEW_CLIENT)
@@ -120,7 +120,7 @@ class ClientContactService:
         payments = (
             self.db.query(Payment)
             .filter(Payment.client_id == client_id, Payment.cancelled_at.is_(None))
-            .order_by(Payment.payment_date.desc())
+            .order_by(Payment.payment_date.desc(), Payment.id.desc())
             .limit(2)
             .all()
         )
@@ -1,16 +1,11 @@
 import logging
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.crud import client as crud_client
 from app.crud import student as crud_student
 from app.crud import user as crud_user
 from app.schemas.user import ClientCreate
-from app.schemas.student import StudentCreate
-from sqlalchemy.orm import Session
-from app.crud import client as crud_client
-from app.crud import student as crud_student
-from app.crud import user as crud_user
-from app.schemas.user import ClientCreate
-from app.schemas.student import StudentCreate
+from app.schemas.student import StudentCreateWithoutClient
 from app.models.user import User
 from app.models.student import Student
 from datetime import datetime
@@ -22,30 +17,45 @@ class ClientService:
 
 
     def create_client_with_students(self, db: Session, client_data: ClientCreate) -> User:
-        # 1. Check for existing user
-        existing_user = crud_user.get_user_by_email(db, email=client_data.email)
-        if existing_user:
+        # 1. Create the client (User); дубликат email/телефона не вставляется
+        try:
+            client = crud_client.create_client(db, client_data)
+        except IntegrityError as e:
+            db.rollback()
+            message = crud_user.unique_violation_message(e)
+            if message is None:
+                raise
+            raise ValueError(message)
+
+        # 2. Insert was skipped: one lookup to tell which field is taken
+        if client is None:
+            existing_user = crud_user.get_user_by_email_or_phone(
+                db, email=client_data.email, phone_number=client_data.phone_number
+            )
+            if existing_user is not None and existing_user.email != client_data.email:
+                raise ValueError("User with this phone number already exists")
             raise ValueError("User with this email already exists")
 
-        # 2. Create the client (User)
-        client = crud_client.create_client(db, client_data)
         logger.info(f'client is_Student value: {client_data.is_student}')
 
         # 3. If client is also a student, create a student record for them
+        # Поля клиента уже провалидированы ClientCreate — повторная валидация не нужна
+        students_data = []
         if client_data.is_student:
-            student_for_client_data = StudentCreate(
+            students_data.append(StudentCreateWithoutClient.model_construct(
                 first_name=client.first_name,
                 last_name=client.last_name,
                 date_of_birth=client.date_of_birth,
-                client_id=client.id
-            )
-            logger.info("Calling create student crud function")
-            crud_student.create_student(db, student_data=student_for_client_data, client_id=client.id)
+            ))
 
         # 4. Create student records for dependent students (children)
         if client_data.students:
-            for student_data in client_data.students:
-                crud_student.create_student(db, student_data=student_data, client_id=client.id)
+            students_data.extend(client_data.students)
+
+        # Все студенты клиента вставляются одним flush вместо commit на каждого
+        if students_data:
+            logger.info("Calling create students crud function")
+            crud_student.create_students(db, students_data, client_id=client.id)
 
         # 5. Commit the transaction
         # 5. Создаём задачу контакта для нового клиента
@@ -66,15 +76,16 @@ class ClientService:
         if not client:
             raise ValueError("Клиент не найден")
         
+        now = datetime.now()
         client.is_active = is_active
-        client.deactivation_date = datetime.now() if not is_active else None
+        client.deactivation_date = now if not is_active else None
         
         affected_students_count = 0
         if not is_active:
             students = db.query(Student).filter(Student.client_id == client_id).all()
             for student in students:
                 student.is_active = False
-                student.deactivation_date = datetime.now()
+                student.deactivation_date = now
                 affected_students_count += 1
         
         db.commit()
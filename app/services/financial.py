@@ -1,8 +1,9 @@
 # app/services/financial.py
 import logging
 from typing import List, Optional
-from datetime import datetime, timedelta
-from sqlalchemy.orm import Session, joinedload
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import func
+from sqlalchemy.orm import Query, Session, selectinload
 
 from app.crud import invoice as invoice_crud
 from app.crud import payment as payment_crud
@@ -20,6 +21,20 @@ from app.database import transactional
 
 logger = logging.getLogger(__name__)
 
+
+def _page_total(query: Query, pk_column, skip: int, limit: int, page_len: int) -> int:
+    """
+    Общее количество строк для пагинированного ответа.
+
+    Если страница неполная, total известен без запроса: skip + page_len.
+    COUNT выполняется только для полной страницы (или пустой страницы
+    за пределами выборки), и без обертки ORM .count() в подзапрос.
+    """
+    if page_len < limit and (page_len > 0 or skip == 0):
+        return skip + page_len
+    return query.with_entities(func.count(pk_column)).order_by(None).scalar() or 0
+
+
 class FinancialService:
     def __init__(self, db: Session):
         self.db = db
@@ -148,6 +163,8 @@ class FinancialService:
         """Core logic to create an invoice and attempt payment. Does not commit."""
         # Create the invoice
         new_invoice = invoice_crud.create_invoice(session, invoice_data)
+        # Нужен id счета для mark_invoice_as_paid
+        session.flush()
 
         if auto_pay:
             # This is a simplified logic. A real system might have more complex rules.
@@ -310,22 +327,14 @@ class FinancialService:
         if created_by_id:
             query = query.filter(PaymentHistory.created_by_id == created_by_id)
 
-        # Date filters (expecting YYYY-MM-DD)
+        # Даты уже разобраны схемой фильтра (date)
         if date_from:
-            try:
-                from_dt = datetime.strptime(date_from, "%Y-%m-%d")
-                query = query.filter(PaymentHistory.created_at >= from_dt)
-            except Exception:
-                pass
+            query = query.filter(PaymentHistory.created_at >= datetime.combine(date_from, time.min))
 
         if date_to:
-            try:
-                to_dt = datetime.strptime(date_to, "%Y-%m-%d")
-                # include the whole day
-                to_dt = to_dt + timedelta(days=1)
-                query = query.filter(PaymentHistory.created_at < to_dt)
-            except Exception:
-                pass
+            # include the whole day
+            to_dt = datetime.combine(date_to + timedelta(days=1), time.min)
+            query = query.filter(PaymentHistory.created_at < to_dt)
 
         if amount_min is not None:
             try:
@@ -345,9 +354,8 @@ class FinancialService:
             except Exception:
                 pass
 
-        total = query.count()
-
-        results = query.order_by(PaymentHistory.created_at.desc()).offset(skip).limit(limit).all()
+        results = query.order_by(PaymentHistory.created_at.desc(), PaymentHistory.id.desc()).offset(skip).limit(limit).all()
+        total = _page_total(query, PaymentHistory.id, skip, limit, len(results))
 
         items = []
         for ph in results:
@@ -517,12 +525,12 @@ class FinancialService:
         # Placeholder for payment history with filters
         return {"items": [], "total": 0, "skip": 0, "limit": 0, "has_more": False}
 
-    def get_trainer_registered_payments(self, trainer_id: int, period: str, client_id: Optional[int], amount_min: Optional[float], amount_max: Optional[float], date_from: Optional[str], date_to: Optional[str], description_search: Optional[str], skip: int, limit: int) -> dict:
+    def get_trainer_registered_payments(self, trainer_id: int, period: str, client_id: Optional[int], amount_min: Optional[float], amount_max: Optional[float], date_from: Optional[date], date_to: Optional[date], description_search: Optional[str], skip: int, limit: int) -> dict:
         """
         Get payments registered by a specific trainer with filtering options.
         """
-        # Query with explicit joinedload to ensure client data is loaded
-        query = self.db.query(Payment).options(joinedload(Payment.client)).filter(Payment.registered_by_id == trainer_id)
+        # Query with explicit selectinload to ensure client data is loaded
+        query = self.db.query(Payment).options(selectinload(Payment.client)).filter(Payment.registered_by_id == trainer_id)
         
         # Apply period filter
         if period:
@@ -539,20 +547,12 @@ class FinancialService:
         
         # Apply date range filters
         if date_from:
-            try:
-                from_date = datetime.strptime(date_from, "%Y-%m-%d")
-                query = query.filter(Payment.payment_date >= from_date)
-            except ValueError:
-                pass  # Invalid date format, skip filter
+            query = query.filter(Payment.payment_date >= datetime.combine(date_from, time.min))
                 
         if date_to:
-            try:
-                to_date = datetime.strptime(date_to, "%Y-%m-%d")
-                # Add 1 day to include the entire day
-                to_date = to_date + timedelta(days=1)
-                query = query.filter(Payment.payment_date < to_date)
-            except ValueError:
-                pass  # Invalid date format, skip filter
+            # Add 1 day to include the entire day
+            to_date = datetime.combine(date_to + timedelta(days=1), time.min)
+            query = query.filter(Payment.payment_date < to_date)
         
         # Apply other filters
         if client_id:
@@ -570,11 +570,11 @@ class FinancialService:
         # Only include non-cancelled payments
         query = query.filter(Payment.cancelled_at.is_(None))
         
-        # Get total count
-        total = query.count()
-        
         # Apply pagination and ordering
-        results = query.order_by(Payment.payment_date.desc()).offset(skip).limit(limit).all()
+        results = query.order_by(Payment.payment_date.desc(), Payment.id.desc()).offset(skip).limit(limit).all()
+
+        # Get total count
+        total = _page_total(query, Payment.id, skip, limit, len(results))
         
         # Debug: Print the first result to see what we're getting
         if results:
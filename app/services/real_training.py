@@ -2,7 +2,7 @@ import logging
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
-from sqlalchemy import and_
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
 from app.crud import real_training as crud
@@ -18,12 +18,13 @@ from app.models import (
 )
 from app.models.real_training import AttendanceStatus
 from app.schemas.real_training import (
+    RealTrainingCreate,
     RealTrainingStudentCreate,
-    RealTrainingStudentUpdate,
     StudentCancellationRequest,
     TrainingCancellationRequest,
     RealTrainingWithTrialStudentCreate,
 )
+from app.schemas.real_training_student import RealTrainingStudentUpdate
 
 from app.database import transactional
 from app.services.financial import FinancialService
@@ -453,22 +454,21 @@ class RealTrainingService:
             raise TrainingNotFound("Тренировка не найдена.")
         
         if student_data.is_trial:
-            student_data.requires_payment = False
-            # Check if student already had a trial training
-            had_trial = session.query(RealTrainingStudent).filter(
+            # Одним запросом проверяем и прошлую пробную, и платные тренировки;
+            # пробная сортируется первой, чтобы сохранить приоритет ошибки
+            previous = session.query(RealTrainingStudent.is_trial).filter(
                 RealTrainingStudent.student_id == student.id,
-                RealTrainingStudent.is_trial == True
-            ).first()
-            if had_trial:
-                raise ValueError("У студента уже была пробная тренировка.")
-
-            # Check if student had any paid trainings
-            had_paid_training = session.query(RealTrainingStudent).filter(
-                RealTrainingStudent.student_id == student.id,
-                RealTrainingStudent.requires_payment == True,
-                RealTrainingStudent.status != AttendanceStatus.CANCELLED_SAFE
-            ).first()
-            if had_paid_training:
+                or_(
+                    RealTrainingStudent.is_trial == True,
+                    and_(
+                        RealTrainingStudent.requires_payment == True,
+                        RealTrainingStudent.status != AttendanceStatus.CANCELLED_SAFE,
+                    ),
+                ),
+            ).order_by(RealTrainingStudent.is_trial.desc()).first()
+            if previous is not None:
+                if previous.is_trial:
+                    raise ValueError("У студента уже была пробная тренировка.")
                 raise ValueError("Студент уже посещал платные тренировки.")
 
         # Check capacity limits
@@ -33,7 +33,7 @@ class StudentService:
                 .filter(
                     and_(
                         StudentSubscription.student_id == student.id,
-                        StudentSubscription.status == "active"
+                        StudentSubscription.active_clause()
                     )
                 )
                 .order_by(StudentSubscription.end_date.desc())
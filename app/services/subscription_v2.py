@@ -313,17 +313,20 @@ def process_auto_renewals_v2(db: Session) -> dict:
     from app.schemas.invoice import InvoiceCreate
     from app.crud import subscription as sub_crud
     from app.crud import student as student_crud
+    from app.crud.subscription_v2 import day_bounds
     from app.services.financial import FinancialService
 
     financial_service = FinancialService(db)
     today = datetime.now(timezone.utc).date()
+    today_start, tomorrow_start = day_bounds(today)
 
     base_query = (
         db.query(StudentSubscription)
         .filter(
             and_(
                 StudentSubscription.is_auto_renew == True,
-                func.date(StudentSubscription.end_date) == today,
+                StudentSubscription.end_date >= today_start,
+                StudentSubscription.end_date < tomorrow_start,
                 StudentSubscription.auto_renewal_invoice_id.is_(None),
                 # Не замороженные
                 ~(
@@ -1,9 +1,10 @@
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta, time
 import os
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session
 
 from app.main import app
@@ -66,6 +67,37 @@ def db_session(engine):
         connection.close()
 
 
+@pytest.fixture
+def count_queries(db_session):
+    """
+    Счетчик SQL-запросов сессии для тестов на N+1.
+
+    Использование:
+        with count_queries(budget=3) as queries:
+            ...
+    Падает, если внутри блока выполнено больше `budget` запросов.
+    """
+    connection = db_session.connection()
+
+    @contextmanager
+    def _count(budget: int):
+        queries = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            queries.append(statement)
+
+        event.listen(connection, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield queries
+        finally:
+            event.remove(connection, "before_cursor_execute", before_cursor_execute)
+        assert len(queries) <= budget, (
+            f"{len(queries)} queries, budget {budget}:\n" + "\n".join(queries)
+        )
+
+    return _count
+
+
 @pytest.fixture
 def auth_headers(client):
     """
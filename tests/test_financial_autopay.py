@@ -0,0 +1,41 @@
+"""Тесты: автооплата гасит инвойсы от старых к новым даже при одинаковом created_at."""
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+
+from app.models import Invoice, InvoiceStatus, InvoiceType, User
+from app.services.financial import FinancialService
+
+
+def test_auto_payment_settles_older_invoice_first_on_created_at_tie(
+    db_session: Session, test_client: User, test_admin: User
+):
+    # В PostgreSQL now() — время начала транзакции, поэтому инвойсы,
+    # созданные в одной транзакции, получают одинаковый created_at
+    created_at = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+    older, newer = (
+        Invoice(
+            client_id=test_client.id,
+            amount=100.0,
+            description=f"Invoice {n}",
+            status=InvoiceStatus.UNPAID,
+            type=InvoiceType.TRAINING,
+            created_at=created_at,
+        )
+        for n in (1, 2)
+    )
+    db_session.add(older)
+    db_session.flush()
+    db_session.add(newer)
+    db_session.flush()
+    assert older.id < newer.id
+
+    FinancialService(db_session)._register_payment_logic(
+        db_session, client_id=test_client.id, amount=100.0, registered_by_id=test_admin.id
+    )
+    db_session.flush()
+    db_session.refresh(older)
+    db_session.refresh(newer)
+
+    assert older.status == InvoiceStatus.PAID
+    assert newer.status == InvoiceStatus.UNPAID
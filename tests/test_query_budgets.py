@@ -0,0 +1,97 @@
+"""Тесты: количество SQL-запросов на списках не растет с числом строк (N+1)."""
+from datetime import date, time
+
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from app.crud.real_training import get_real_trainings_with_students
+from app.crud.student import get_all_students
+from app.models import (
+    Invoice, InvoiceStatus, InvoiceType, RealTraining, RealTrainingStudent, Student, TrainingType, User, UserRole,
+)
+from app.schemas.real_training import RealTrainingResponse
+from app.schemas.student import StudentResponse
+
+
+def _make_clients_with_students(db: Session, count: int) -> list[Student]:
+    students = []
+    for i in range(count):
+        client = User(
+            first_name=f"Client{i}",
+            last_name="Budget",
+            date_of_birth=date(1990, 1, 1),
+            email=f"budget{i}@example.com",
+            phone_country_code="1",
+            phone_number=f"55500{i:03d}",
+            role=UserRole.CLIENT,
+            balance=0,
+        )
+        db.add(client)
+        db.flush()
+        student = Student(
+            client_id=client.id,
+            first_name=f"Student{i}",
+            last_name="Budget",
+            date_of_birth=date(2015, 1, 1),
+        )
+        db.add(student)
+        students.append(student)
+    db.flush()
+    return students
+
+
+def test_students_list_loads_clients_in_one_query(db_session: Session, count_queries):
+    debtor = _make_clients_with_students(db_session, 5)[0]
+    db_session.add(Invoice(
+        client_id=debtor.client_id,
+        student_id=debtor.id,
+        amount=100.0,
+        description="Unpaid",
+        status=InvoiceStatus.UNPAID,
+        type=InvoiceType.SUBSCRIPTION,
+    ))
+    db_session.flush()
+    db_session.expire_all()
+
+    # students (вместе с has_unpaid_invoice) + clients
+    with count_queries(budget=2):
+        students = get_all_students(db_session)
+        content = StudentResponse.list_json(students)
+
+    adapter = TypeAdapter(list[StudentResponse])
+    response = adapter.validate_python(students, from_attributes=True)
+    assert content == adapter.dump_json(response)
+    unpaid = {item.id for item in response if item.has_unpaid_invoice}
+    assert unpaid == {debtor.id}
+
+
+def test_real_trainings_list_has_constant_query_count(db_session: Session, test_trainer, count_queries):
+    training_type = TrainingType(name="Budget", price=10.0, color="#000000", is_active=True, max_participants=10)
+    db_session.add(training_type)
+    db_session.flush()
+    students = _make_clients_with_students(db_session, 4)
+
+    for day in range(1, 4):
+        training = RealTraining(
+            training_date=date(2030, 1, day),
+            start_time=time(10, 0),
+            responsible_trainer_id=test_trainer.id,
+            training_type_id=training_type.id,
+        )
+        db_session.add(training)
+        db_session.flush()
+        for student in students:
+            db_session.add(RealTrainingStudent(real_training_id=training.id, student_id=student.id))
+    db_session.flush()
+    db_session.expire_all()
+
+    # trainings, students, student, client, trainer, training_type
+    with count_queries(budget=6):
+        trainings = get_real_trainings_with_students(
+            db_session, start_date=date(2030, 1, 1), end_date=date(2030, 1, 31)
+        )
+        content = RealTrainingResponse.list_json(trainings)
+
+    # Сборка без валидации дает тот же JSON, что и model_validate
+    adapter = TypeAdapter(list[RealTrainingResponse])
+    assert content == adapter.dump_json(adapter.validate_python(trainings, from_attributes=True))